@@ -1,47 +1,73 @@
 # Public API
-from .api import KotInjection
-from .component import IsolatedKotInjectionComponent
-from .context import KotInjectionContext
-from .core import KotInjectionCore
-from .exceptions import (
-    AlreadyStartedError,
-    CircularDependencyError,
-    ContainerClosedError,
-    DefinitionNotFoundError,
-    DuplicateDefinitionError,
-    KotInjectionError,
-    NotInitializedError,
-    ResolutionContextError,
-    TypeInferenceError,
-)
-from .global_context import GlobalContext
-from .inject_descriptor import InjectDescriptor
-from .inject_proxy import create_inject
-from .lifecycle import KotInjectionLifeCycle
-from .module import KotInjectionModule
-
-__all__ = [
-    "KotInjection",
-    "KotInjectionCore",
-    "IsolatedKotInjectionComponent",
-    "KotInjectionContext",
-    "GlobalContext",
-    "KotInjectionModule",
-    "KotInjectionLifeCycle",
+#
+# Symbols are imported lazily on first attribute access (PEP 562) so that
+# ``import kotinjection`` does not load every submodule up front.
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .api import KotInjection
+    from .component import IsolatedKotInjectionComponent
+    from .context import KotInjectionContext
+    from .core import KotInjectionCore
+    from .exceptions import (
+        AlreadyStartedError,
+        CircularDependencyError,
+        ContainerClosedError,
+        DefinitionNotFoundError,
+        DuplicateDefinitionError,
+        KotInjectionError,
+        NotInitializedError,
+        ResolutionContextError,
+        TypeInferenceError,
+    )
+    from .global_context import GlobalContext
+    from .inject_descriptor import InjectDescriptor
+    from .inject_proxy import create_inject
+    from .lifecycle import KotInjectionLifeCycle
+    from .module import KotInjectionModule
+
+# Public name -> (submodule, attribute) used by __getattr__
+_LAZY = {
+    "KotInjection": (".api", "KotInjection"),
+    "KotInjectionCore": (".core", "KotInjectionCore"),
+    "IsolatedKotInjectionComponent": (".component", "IsolatedKotInjectionComponent"),
+    "KotInjectionContext": (".context", "KotInjectionContext"),
+    "GlobalContext": (".global_context", "GlobalContext"),
+    "KotInjectionModule": (".module", "KotInjectionModule"),
+    "KotInjectionLifeCycle": (".lifecycle", "KotInjectionLifeCycle"),
     # Inject
-    "InjectDescriptor",
-    "create_inject",
+    "InjectDescriptor": (".inject_descriptor", "InjectDescriptor"),
+    "create_inject": (".inject_proxy", "create_inject"),
     # Exceptions
-    "KotInjectionError",
-    "AlreadyStartedError",
-    "NotInitializedError",
-    "ContainerClosedError",
-    "DuplicateDefinitionError",
-    "DefinitionNotFoundError",
-    "CircularDependencyError",
-    "TypeInferenceError",
-    "ResolutionContextError",
-]
+    "KotInjectionError": (".exceptions", "KotInjectionError"),
+    "AlreadyStartedError": (".exceptions", "AlreadyStartedError"),
+    "NotInitializedError": (".exceptions", "NotInitializedError"),
+    "ContainerClosedError": (".exceptions", "ContainerClosedError"),
+    "DuplicateDefinitionError": (".exceptions", "DuplicateDefinitionError"),
+    "DefinitionNotFoundError": (".exceptions", "DefinitionNotFoundError"),
+    "CircularDependencyError": (".exceptions", "CircularDependencyError"),
+    "TypeInferenceError": (".exceptions", "TypeInferenceError"),
+    "ResolutionContextError": (".exceptions", "ResolutionContextError"),
+}
+
+__all__ = tuple(_LAZY)
+
+
+def __getattr__(name: str):
+    """Import a public symbol on first access and cache it in globals()."""
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return list(__all__)
+
 
 # Version will be dynamically set by poetry-dynamic-versioning
 try:
@@ -20,7 +20,7 @@ Example::
     KotInjection.stop()
 """
 
-from typing import List
+from typing import Iterable
 
 from .get_proxy import KotInjectionGetProxy
 from .inject_proxy import KotInjectionInjectProxy
@@ -67,20 +67,20 @@ class KotInjection:
     _context: GlobalContext = GlobalContext()
 
     # Proxy object supporting get[Type]() syntax (eager)
-    get = KotInjectionGetProxy(lambda: KotInjection._context.get_or_null())
+    get = KotInjectionGetProxy(lambda: KotInjection._context)
 
     # Proxy object supporting inject[Type] syntax (lazy)
-    inject = KotInjectionInjectProxy(lambda: KotInjection._context.get_or_null())
+    inject = KotInjectionInjectProxy(lambda: KotInjection._context)
 
     @classmethod
-    def start(cls, modules: List[KotInjectionModule]) -> None:
+    def start(cls, modules: Iterable[KotInjectionModule]) -> None:
         """Start KotInjection.
 
         Internally creates a KotInjectionCore instance and uses it
         as the global container.
 
         Args:
-            modules: List of DI modules
+            modules: DI modules (any iterable)
 
         Raises:
             AlreadyStartedError: When KotInjection is already started.
@@ -127,17 +127,21 @@ class KotInjection:
             KotInjection.stop()
             print(KotInjection.is_started())  # False
         """
-        return cls._context.get_or_null() is not None
+        context = cls._context
+        started = context._started
+        if started is None:
+            return context.get_or_null() is not None
+        return started
 
     @classmethod
-    def load_modules(cls, modules: List[KotInjectionModule]) -> None:
+    def load_modules(cls, modules: Iterable[KotInjectionModule]) -> None:
         """Load additional modules after KotInjection has started.
 
         This method allows dynamically adding new dependency definitions
         to the running container.
 
         Args:
-            modules: List of KotInjectionModule instances to load
+            modules: KotInjectionModule instances (any iterable) to load
 
         Raises:
             NotInitializedError: When KotInjection.start() has not been called
@@ -154,14 +158,14 @@ class KotInjection:
         cls._context.load_modules(modules)
 
     @classmethod
-    def unload_modules(cls, modules: List[KotInjectionModule]) -> None:
+    def unload_modules(cls, modules: Iterable[KotInjectionModule]) -> None:
         """Unload modules from the global container.
 
         This method removes dependency definitions that were loaded
         from the specified modules.
 
         Args:
-            modules: List of KotInjectionModule instances to unload
+            modules: KotInjectionModule instances (any iterable) to unload
 
         Raises:
             NotInitializedError: When KotInjection.start() has not been called
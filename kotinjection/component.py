@@ -49,6 +49,8 @@ class IsolatedKotInjectionComponent(ABC):
         - Multi-tenancy: Create isolated components for each tenant
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def get_app(self) -> 'KotInjectionCore':
         """
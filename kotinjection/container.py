@@ -14,22 +14,65 @@ The container is typically not used directly. Instead, use KotInjection
 (global API) or KotInjectionCore (isolated container) classes.
 """
 
-from typing import Any, Callable, cast, Dict, List, Type, TypeVar
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, TypeVar
 
 from .resolution_context import _resolution_context
 from .definition import Definition
+from .definition_builder import DefinitionBuilder
 from .exceptions import (
     CircularDependencyError,
     DefinitionNotFoundError,
     DuplicateDefinitionError,
+    ResolutionContextError,
     TypeInferenceError,
 )
-from .lifecycle import KotInjectionLifeCycle
 from .module import KotInjectionModule
 from .resolution_context import ResolutionContext
 
 T = TypeVar('T')
 
+# Maximum number of idle ResolutionContext objects kept per container
+_CONTEXT_POOL_SIZE = 16
+
+
+class _DefinitionDict(Dict[Type, Definition]):
+    """Definition lookup table that raises DefinitionNotFoundError on a miss.
+
+    Subscripting a missing type calls __missing__, which keeps the error
+    formatting out of the resolution path: a successful lookup is a single
+    ``definitions[interface]``.
+
+    Attributes:
+        registered_names: Registered type names for error messages, built
+            on the first miss and reset by the container whenever
+            definitions change
+    """
+
+    __slots__ = ("registered_names",)
+
+    def __init__(self):
+        super().__init__()
+        self.registered_names: Optional[str] = None
+
+    def __missing__(self, interface: Type) -> Definition:
+        # Handle both Type and string (forward reference) cases
+        interface_name = interface.__name__ if hasattr(interface, '__name__') else str(interface)
+
+        registered_types = self.registered_names
+        if registered_types is None:
+            registered_types = ", ".join([
+                getattr(t, '__name__', None) or str(t)
+                for t in self
+            ]) or "None"
+            self.registered_names = registered_types
+
+        raise DefinitionNotFoundError(
+            f"{interface_name} is not registered.\n"
+            f"Registered types: {registered_types}\n"
+            f"Hint: module.single[{interface_name}](lambda: {interface_name}())"
+        )
+
 
 class KotInjectionContainer:
     """Core DI Container with dependency resolution and lifecycle management.
@@ -45,21 +88,45 @@ class KotInjectionContainer:
 
     Attributes:
         _definitions: Dictionary mapping types to their Definition objects
+        _singleton_cache: Dictionary mapping types to already-created
+            singleton instances (fast path for resolution)
+        _resolvers: Dictionary mapping types to resolver closures that are
+            specialized per definition at load time (top-level calls only)
+        _context_pool: Free list of ResolutionContext objects reused by
+            _create_instance and dry-runs once their factory call has finished
+        _getters: Callables returned by container[Type], memoized per
+            registered type (bound to this container until evicted)
+        _eager_definitions: Loaded singleton definitions with
+            created_at_start=True that eager_initialize() has not handled yet
 
     Note:
         This class is typically not instantiated directly. Use KotInjection
         or KotInjectionCore instead.
     """
 
+    __slots__ = (
+        "_definitions",
+        "_singleton_cache",
+        "_resolvers",
+        "_context_pool",
+        "_getters",
+        "_eager_definitions",
+    )
+
     def __init__(self):
         """Initialize an empty container.
 
         Creates a new container with no registered definitions.
         Use load_modules() to add dependency definitions.
         """
-        self._definitions: Dict[Type, Definition] = {}
-
-    def load_modules(self, modules: List[KotInjectionModule]):
+        self._definitions: _DefinitionDict = _DefinitionDict()
+        self._singleton_cache: Dict[Type, Any] = {}
+        self._resolvers: Dict[Type, Callable[[], Any]] = {}
+        self._context_pool: List[ResolutionContext] = []
+        self._getters: Dict[Type, Callable[[], Any]] = {}
+        self._eager_definitions: List[Definition] = []
+
+    def load_modules(self, modules: Iterable[KotInjectionModule]):
         """Load modules and register their definitions.
 
         Processes each module and adds its definitions to the container.
@@ -67,11 +134,12 @@ class KotInjectionContainer:
         this operation is fast.
 
         Args:
-            modules: List of KotInjectionModule instances to load
+            modules: KotInjectionModule instances (any iterable) to load
 
         Raises:
             DuplicateDefinitionError: When a type is already registered.
                 This prevents accidental overwriting of existing definitions.
+                Nothing from the given modules is registered in that case.
 
         Example::
 
@@ -82,13 +150,28 @@ class KotInjectionContainer:
             container = KotInjectionContainer()
             container.load_modules([module])
         """
+        # Validate everything first, then apply the new entries in bulk
+        definitions = self._definitions
+        new_definitions: Dict[Type, Definition] = {}
         for module in modules:
             for definition in module.definitions:
-                if definition.interface in self._definitions:
+                interface = definition.interface
+                if interface in definitions or interface in new_definitions:
                     raise DuplicateDefinitionError(
-                        f"{definition.interface} is already registered"
+                        f"{interface} is already registered"
                     )
-                self._definitions[definition.interface] = definition
+                new_definitions[interface] = definition
+
+        definitions.registered_names = None
+        definitions.update(new_definitions)
+        make_resolver = self._make_resolver
+        self._resolvers.update(
+            {interface: make_resolver(definition) for interface, definition in new_definitions.items()}
+        )
+        self._eager_definitions.extend(
+            definition for definition in new_definitions.values()
+            if definition._is_singleton and definition.created_at_start
+        )
 
     def get(self, interface: Type[T]) -> T:
         """Get dependency with automatic type inference.
@@ -127,11 +210,23 @@ class KotInjectionContainer:
 
         if ctx is None:
             # Top-level call - use the provided interface
-            return self._resolve(interface)
+            instance = self._singleton_cache.get(interface)
+            if instance is not None:
+                return instance
+            resolver = self._resolvers.get(interface)
+            if resolver is None:
+                # Not registered - _resolve raises DefinitionNotFoundError
+                return self._resolve(interface)
+            return resolver()
         else:
             # get() called from within a factory - use shared logic
-            param_type = ctx.get_next_parameter_type()
-            return self._resolve(cast(Type[T], param_type))
+            # Annotated instead of cast(): keeps the type checker informed
+            # without a function call per nested get()
+            param_type: Type[T] = ctx.get_next_parameter_type()
+            instance = self._singleton_cache.get(param_type)
+            if instance is not None:
+                return instance
+            return self._resolve(param_type)
 
     def resolve(self, interface: Type[T]) -> T:
         """Resolve a dependency by its interface type (direct resolution).
@@ -155,6 +250,9 @@ class KotInjectionContainer:
             # Always resolves Database, regardless of context
             db = container.resolve(Database)
         """
+        instance = self._singleton_cache.get(interface)
+        if instance is not None:
+            return instance
         return self._resolve(interface)
 
     def _resolve(self, interface: Type[T]) -> T:
@@ -177,23 +275,12 @@ class KotInjectionContainer:
             DefinitionNotFoundError: When the interface is not registered
             CircularDependencyError: When a circular dependency is detected
         """
-        definition = self._definitions.get(interface)
-        if definition is None:
-            # Handle both Type and string (forward reference) cases
-            interface_name = interface.__name__ if hasattr(interface, '__name__') else str(interface)
-            registered_types = ", ".join(
-                t.__name__ if hasattr(t, '__name__') else str(t)
-                for t in self._definitions.keys()
-            ) or "None"
-
-            raise DefinitionNotFoundError(
-                f"{interface_name} is not registered.\n"
-                f"Registered types: {registered_types}\n"
-                f"Hint: module.single[{interface_name}](lambda: {interface_name}())"
-            )
+        # Raises DefinitionNotFoundError via _DefinitionDict.__missing__
+        definition = self._definitions[interface]
 
         # Already instantiated singleton
-        if definition.lifecycle == KotInjectionLifeCycle.SINGLETON and definition.instance is not None:
+        if definition._is_singleton and definition.instance is not None:
+            self._singleton_cache[interface] = definition.instance
             return definition.instance
 
         # Circular dependency check
@@ -203,15 +290,58 @@ class KotInjectionContainer:
             raise CircularDependencyError(f"Circular dependency detected: {cycle}")
 
         # Create instance
-        instance = self._create_instance(interface, definition)
+        instance = self._create_instance(interface, definition, ctx)
 
         # Cache if singleton
-        if definition.lifecycle == KotInjectionLifeCycle.SINGLETON:
+        if definition._is_singleton:
             definition.instance = instance
+            self._singleton_cache[interface] = instance
 
         return instance
 
-    def _create_instance(self, interface: Type, definition: Definition) -> Any:
+    def _make_resolver(self, definition: Definition) -> Callable[[], Any]:
+        """Build a resolver closure specialized for a single definition.
+
+        The closure already knows the interface, the definition and its
+        lifecycle, so calling it skips the definition lookup and the
+        lifecycle branch in _resolve.
+
+        Resolvers are only used for top-level calls (no active resolution
+        context). Nested resolutions go through _resolve, which performs
+        the circular dependency check.
+
+        Args:
+            definition: The Definition to build a resolver for
+
+        Returns:
+            A zero-argument callable returning the resolved instance
+        """
+        interface = definition.interface
+        create_instance = self._create_instance
+        singleton_cache = self._singleton_cache
+
+        if definition._is_singleton:
+            def resolve_singleton() -> Any:
+                instance = definition.instance
+                if instance is None:
+                    instance = create_instance(interface, definition, None)
+                    definition.instance = instance
+                singleton_cache[interface] = instance
+                return instance
+
+            return resolve_singleton
+
+        def resolve_factory() -> Any:
+            return create_instance(interface, definition, None)
+
+        return resolve_factory
+
+    def _create_instance(
+        self,
+        interface: Type,
+        definition: Definition,
+        parent_ctx: Optional[ResolutionContext]
+    ) -> Any:
         """Create an instance using the factory function.
 
         This method:
@@ -224,6 +354,9 @@ class KotInjectionContainer:
         Args:
             interface: The type being instantiated
             definition: The Definition containing factory and metadata
+            parent_ctx: The resolution context active in the caller, or None
+                for a top-level resolution. Callers have already read it,
+                so it is passed in rather than read from the ContextVar again.
 
         Returns:
             The newly created instance
@@ -235,68 +368,130 @@ class KotInjectionContainer:
         Note:
             - Singleton: Parameter types are lazily resolved on first access
               via dry-run, then cached for subsequent resolutions.
-            - Factory: Dry-run is executed every time to support factories
-              that return different implementation types.
+            - Factory: The first resolution runs a dry-run. Later resolutions
+              reuse the parameter types of the implementation class seen
+              last and check that the factory returned the same class. If
+              it did not, or it raised any error, the instance is created
+              again via dry-run, which reports errors that persist. In both
+              cases the definition dry-runs from then on. Factories whose
+              bytecode branches (e.g. ``B() if flag else A()``) always
+              dry-run, as they may pick a different class each time.
+            - Factories whose bytecode makes no call (e.g. ``lambda: config``)
+              cannot call get() and skip the dry-run. The returned object's
+              constructor is still analyzed after the call, so missing type
+              hints are reported as before. If such a factory reaches get()
+              anyway (e.g. through a property), the definition falls back
+              to dry-run discovery.
         """
         # Type discovery strategy depends on lifecycle
-        if definition.lifecycle == KotInjectionLifeCycle.FACTORY:
-            # Factory: Always run dry-run (may return different implementations)
-            parameter_types = self._discover_parameter_types(interface, definition)
+        optimistic = False
+        if not definition._needs_dry_run:
+            # Factory makes no calls, so it cannot call get(): nothing to infer
+            parameter_types = ()
+        elif not definition._is_singleton:
+            impl_type = definition.implementation_type
+            if impl_type is not None and definition._stable_impl:
+                # Factory: Reuse the types of the last implementation class
+                parameter_types = DefinitionBuilder._get_parameter_types(impl_type)
+                optimistic = True
+            else:
+                # Factory: Run dry-run (may return different implementations)
+                parameter_types = self._discover_parameter_types(interface, definition, parent_ctx)
         else:
             # Singleton: Lazy discovery with caching
             if definition.parameter_types is None:
-                self._discover_and_cache_parameter_types(interface, definition)
+                self._discover_and_cache_parameter_types(interface, definition, parent_ctx)
             parameter_types = definition.parameter_types
 
-        # Create a new resolution context
-        parent_ctx = _resolution_context.get()
-        ctx = ResolutionContext()
+        # Take a resolution context from the pool (or create one) and reset it
+        context_pool = self._context_pool
+        try:
+            ctx = context_pool.pop()
+        except IndexError:
+            ctx = ResolutionContext()
         ctx.parameter_types = parameter_types
         ctx.current_index = 0
         ctx.container = self  # Set current container
 
+        # Share the parent's resolution chain and push this interface onto it.
+        # The entry is popped again in the finally block below.
         if parent_ctx is not None:
-            ctx.resolving = parent_ctx.resolving.copy()
-
-        ctx.resolving.add(interface)
+            resolving = parent_ctx.resolving
+        else:
+            resolving = []
+        ctx.resolving = resolving
+        resolving.append(interface)
 
         # Set context and execute factory
+        retry = False
         token = _resolution_context.set(ctx)
         try:
             instance = definition.factory()
 
+            if not definition._needs_dry_run:
+                # Validate the constructor signature as the dry-run would have.
+                # Type registrations know their implementation and analyze it
+                # in the auto-factory already.
+                if definition.implementation_type is None:
+                    DefinitionBuilder._get_parameter_types(type(instance))
+            elif not definition._is_singleton and type(instance) is not definition.implementation_type:
+                # Polymorphic factory: dry-run it on every resolution from now on
+                definition._stable_impl = False
+                # Optimistically resolved dependencies belong to another class
+                retry = optimistic
+
             # Validate return type (only in debug mode for performance)
             # Skip validation if interface is ABC or Protocol (implementation returns subclass)
+            # Exact type matches, the common case, skip the isinstance() call
             if __debug__:
-                from abc import ABC
-                is_abstract = hasattr(interface, '__abstractmethods__') or (
-                    isinstance(interface, type) and issubclass(interface, ABC)
-                )
-                if not is_abstract and not isinstance(instance, interface):
+                if (
+                    not retry
+                    and not definition._skip_validation
+                    and type(instance) is not interface
+                    and not isinstance(instance, interface)
+                ):
                     raise TypeInferenceError(
                         f"Factory for {interface.__name__} returned {type(instance).__name__}, "
                         f"expected {interface.__name__}. "
                         f"Ensure the factory returns the correct type."
                     )
-
-            return instance
-        except (DefinitionNotFoundError, CircularDependencyError, TypeInferenceError):
-            # Re-raise KotInjection exceptions as-is
-            raise
         except Exception as e:
-            # Wrap unexpected factory exceptions with context
-            raise TypeInferenceError(
-                f"Factory for {interface.__name__} raised an exception: {e}\n"
-                f"Ensure the factory function executes without errors."
-            ) from e
+            if optimistic:
+                # The reused parameter types may not match what the factory
+                # resolved this time (e.g. another implementation's dependency
+                # was passed in). Do not rely on them from now on and retry
+                # via dry-run, which reports the error if it persists.
+                definition._stable_impl = False
+                retry = True
+            elif isinstance(e, (DefinitionNotFoundError, CircularDependencyError, TypeInferenceError)):
+                # Re-raise KotInjection exceptions as-is
+                raise
+            elif isinstance(e, ResolutionContextError) and not definition._needs_dry_run:
+                # The factory calls get() indirectly - discover types via dry-run
+                definition._needs_dry_run = True
+                retry = True
+            else:
+                # Wrap unexpected factory exceptions with context
+                raise TypeInferenceError(
+                    f"Factory for {interface.__name__} raised an exception: {e}\n"
+                    f"Ensure the factory function executes without errors."
+                ) from e
         finally:
             _resolution_context.reset(token)
+            resolving.pop()
+            if len(context_pool) < _CONTEXT_POOL_SIZE:
+                context_pool.append(ctx)
+
+        if retry:
+            return self._create_instance(interface, definition, parent_ctx)
+        return instance
 
     def _discover_parameter_types(
         self,
         interface: Type,
-        definition: Definition
-    ) -> List[Type]:
+        definition: Definition,
+        parent_ctx: Optional[ResolutionContext] = None
+    ) -> Tuple[Type, ...]:
         """Discover parameter types via dry-run without caching.
 
         Used for Factory lifecycle where different implementations
@@ -305,20 +500,32 @@ class KotInjectionContainer:
         Args:
             interface: The interface type being resolved
             definition: The Definition containing the factory
+            parent_ctx: The caller's resolution context, whose resolution
+                chain is shared by the dry-run context (None at top level)
 
         Returns:
-            List of parameter types for the implementation class
+            Tuple of parameter types for the implementation class
 
         Raises:
             TypeInferenceError: When type discovery fails
         """
-        from .definition_builder import DefinitionBuilder
 
-        # Create dry-run context
-        ctx = ResolutionContext()
+        # Take a dry-run context from the pool, sharing the caller's resolution chain
+        context_pool = self._context_pool
+        try:
+            ctx = context_pool.pop()
+        except IndexError:
+            ctx = ResolutionContext()
+        ctx.parameter_types = ()
+        ctx.current_index = 0
         ctx.dry_run = True
         ctx.container = self  # Set container for module.get[Type]() to work
-        ctx.resolving.add(interface)
+        if parent_ctx is not None:
+            resolving = parent_ctx.resolving
+        else:
+            resolving = []
+        ctx.resolving = resolving
+        resolving.append(interface)
 
         token = _resolution_context.set(ctx)
         try:
@@ -327,6 +534,7 @@ class KotInjectionContainer:
 
             # Get the actual implementation type
             impl_type = type(instance)
+            definition.implementation_type = impl_type
 
             # Analyze implementation class constructor
             return DefinitionBuilder._get_parameter_types(impl_type)
@@ -341,11 +549,17 @@ class KotInjectionContainer:
             ) from e
         finally:
             _resolution_context.reset(token)
+            resolving.pop()
+            # Pooled contexts are handed out in non-dry-run mode
+            ctx.dry_run = False
+            if len(context_pool) < _CONTEXT_POOL_SIZE:
+                context_pool.append(ctx)
 
     def _discover_and_cache_parameter_types(
         self,
         interface: Type,
-        definition: Definition
+        definition: Definition,
+        parent_ctx: Optional[ResolutionContext] = None
     ) -> None:
         """Discover implementation type via dry-run and cache parameter types.
 
@@ -355,23 +569,24 @@ class KotInjectionContainer:
         Args:
             interface: The interface type being resolved
             definition: The Definition to update with discovered types
+            parent_ctx: The caller's resolution context (None at top level)
 
         Raises:
             TypeInferenceError: When type discovery fails
         """
-        parameter_types = self._discover_parameter_types(interface, definition)
+        parameter_types = self._discover_parameter_types(interface, definition, parent_ctx)
 
         # Cache the results for singleton
         definition.parameter_types = parameter_types
 
-    def unload_modules(self, modules: List[KotInjectionModule]):
+    def unload_modules(self, modules: Iterable[KotInjectionModule]):
         """Unload modules and remove their definitions.
 
         Removes all definitions that were loaded from the specified modules.
         Any cached singleton instances for these definitions are also released.
 
         Args:
-            modules: List of KotInjectionModule instances to unload
+            modules: KotInjectionModule instances (any iterable) to unload
 
         Note:
             If a definition was overwritten or doesn't exist, it is silently
@@ -383,10 +598,44 @@ class KotInjectionContainer:
             container.unload_modules([old_module])
             container.load_modules([new_module])
         """
+        definitions = self._definitions
+        definitions.registered_names = None
         for module in modules:
             for definition in module.definitions:
-                if definition.interface in self._definitions:
-                    del self._definitions[definition.interface]
+                interface = definition.interface
+                if definitions.pop(interface, None) is not None:
+                    self._singleton_cache.pop(interface, None)
+                    self._resolvers.pop(interface, None)
+                    self._getters.pop(interface, None)
+
+        # Drop pending eager definitions that are no longer registered
+        if self._eager_definitions:
+            self._eager_definitions = [
+                definition for definition in self._eager_definitions
+                if definitions.get(definition.interface) is definition
+            ]
+
+    def clear(self) -> None:
+        """Drop all definitions and every reference the container holds.
+
+        Releases the registered definitions, the singleton instance cache,
+        resolver closures, pooled resolution contexts and memoized getters,
+        so objects referenced only by this container can be freed at once.
+        Singleton instances stored on the loaded definitions are reset too.
+
+        Note:
+            Definitions belong to their module. Another container that loaded
+            the same module creates its singletons again after this call.
+        """
+        for definition in self._definitions.values():
+            definition.instance = None
+        self._definitions.clear()
+        self._definitions.registered_names = None
+        self._singleton_cache.clear()
+        self._resolvers.clear()
+        self._context_pool.clear()
+        self._getters.clear()
+        self._eager_definitions.clear()
 
     def __getitem__(self, interface: Type[T]) -> Callable[[], T]:
         """Support subscript syntax: container[Type]().
@@ -406,11 +655,18 @@ class KotInjectionContainer:
             # These are equivalent:
             service = container[MyService]()
             service = container.get(MyService)
-        """
-
-        def getter() -> T:
-            return self.get(interface)
 
+        Note:
+            The returned callable only binds the container and the type, so
+            it is created once per registered type and reused by later
+            subscripts until the type is unloaded or the container cleared.
+            Callables for unregistered types are not kept.
+        """
+        getter = self._getters.get(interface)
+        if getter is None:
+            getter = partial(self.get, interface)
+            if interface in self._definitions:
+                self._getters[interface] = getter
         return getter
 
     def eager_initialize(self) -> None:
@@ -420,7 +676,9 @@ class KotInjectionContainer:
         that were registered with the `created_at_start=True` flag.
 
         Only SINGLETON definitions with `created_at_start=True` and no existing
-        instance will be initialized.
+        instance will be initialized. load_modules() collects these definitions
+        in a worklist, so this method does not scan every registered definition.
+        The worklist is cleared once all of them have been initialized.
 
         Example::
 
@@ -431,8 +689,8 @@ class KotInjectionContainer:
             container.load_modules([module])
             container.eager_initialize()  # Database instance created here
         """
-        for definition in self._definitions.values():
-            if (definition.lifecycle == KotInjectionLifeCycle.SINGLETON
-                    and definition.created_at_start
-                    and definition.instance is None):
+        pending = self._eager_definitions
+        for definition in pending:
+            if definition.instance is None:
                 self._resolve(definition.interface)
+        pending.clear()
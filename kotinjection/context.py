@@ -35,8 +35,21 @@ class KotInjectionContext(ABC):
                 return self._app
 
             # ... implement other methods ...
+
+    Attributes:
+        _cached_app: The active KotInjectionCore, kept up to date by
+            implementations that want the global proxies to skip
+            get_or_null() on every lookup. None means "not cached".
+            The proxies resolve through its ``get`` attribute, so a closed
+            app still raises ContainerClosedError.
+        _started: Whether the context is started, for implementations that
+            track it as a flag. None means "not tracked", and
+            KotInjection.is_started() falls back to get_or_null().
     """
 
+    _cached_app: Optional['KotInjectionCore'] = None
+    _started: Optional[bool] = None
+
     @abstractmethod
     def get(self) -> 'KotInjectionCore':
         """Get the current KotInjectionCore instance.
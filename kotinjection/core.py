@@ -22,7 +22,7 @@ Example::
     # close() is called automatically
 """
 
-from typing import List, TypeVar, Optional
+from typing import Iterable, TypeVar, Optional
 
 from .container import KotInjectionContainer
 from .exceptions import ContainerClosedError
@@ -31,6 +31,35 @@ from .module import KotInjectionModule
 T = TypeVar('T')
 
 
+class _ClosedContainer:
+    """Stand-in for the container of a closed KotInjectionCore.
+
+    Installed as `KotInjectionCore.get` by close(). Subscripting it or
+    reading any container attribute raises ContainerClosedError, so
+    `app.get[Type]()` on a closed container fails as before. Dunder lookups
+    raise AttributeError instead, so protocol probes such as copy's
+    `__deepcopy__` check behave normally. A single shared instance,
+    _CLOSED_CONTAINER, also serves as the closed-state marker; copying or
+    pickling it yields that same instance.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, interface):
+        raise ContainerClosedError("This container is already closed")
+
+    def __getattr__(self, name):
+        if name.startswith('__') and name.endswith('__'):
+            raise AttributeError(name)
+        raise ContainerClosedError("This container is already closed")
+
+    def __reduce__(self):
+        return '_CLOSED_CONTAINER'
+
+
+_CLOSED_CONTAINER = _ClosedContainer()
+
+
 class KotInjectionCore:
     """Isolated KotInjection container instance.
 
@@ -38,8 +67,12 @@ class KotInjectionCore:
     Ideal for library development, multi-tenant applications, and test isolation.
 
     Attributes:
+        get: The container used for `get[Type]()` retrieval. It is a plain
+            instance attribute, so no descriptor runs on each access.
+            close() replaces it with the shared _CLOSED_CONTAINER stand-in,
+            which raises ContainerClosedError; the instance is closed
+            exactly when `get` is that stand-in.
         _container: Internal KotInjectionContainer instance
-        _closed: Flag indicating if the container has been closed
 
     Example::
 
@@ -54,11 +87,13 @@ class KotInjectionCore:
         app2 = KotInjectionCore(modules=[module2])
     """
 
-    def __init__(self, modules: Optional[List[KotInjectionModule]] = None):
+    __slots__ = ("get", "_container", "__weakref__")
+
+    def __init__(self, modules: Optional[Iterable[KotInjectionModule]] = None):
         """Initialize an isolated container instance.
 
         Args:
-            modules: List of DI modules to load initially (optional)
+            modules: DI modules to load initially (any iterable, optional)
 
         Example::
 
@@ -69,11 +104,13 @@ class KotInjectionCore:
             app = KotInjectionCore(modules=[module])
         """
         self._container: KotInjectionContainer = KotInjectionContainer()
-        self._closed: bool = False
+        # Supports the subscript syntax get[Type]() for dependency retrieval
+        self.get: KotInjectionContainer = self._container
 
-        # Load modules if specified
+        # Load modules if specified (a new container cannot be closed yet)
         if modules:
-            self.load_modules(modules)
+            self._container.load_modules(modules)
+            self._container.eager_initialize()
 
     def _ensure_not_closed(self) -> None:
         """Ensure the container is not closed.
@@ -83,31 +120,10 @@ class KotInjectionCore:
         Raises:
             ContainerClosedError: When the container has been closed
         """
-        if self._closed:
+        if self.get is _CLOSED_CONTAINER:
             raise ContainerClosedError("This container is already closed")
 
-    @property
-    def get(self) -> KotInjectionContainer:
-        """Container property for getting dependencies.
-
-        This property returns the internal container, which supports
-        the subscript syntax `get[Type]()` for dependency retrieval.
-
-        Returns:
-            KotInjectionContainer: The DI container for dependency resolution
-
-        Raises:
-            ContainerClosedError: When the container has been closed
-
-        Example::
-
-            app = KotInjectionCore(modules=[my_module])
-            service = app.get[MyService]()
-        """
-        self._ensure_not_closed()
-        return self._container
-
-    def load_modules(self, modules: List[KotInjectionModule]):
+    def load_modules(self, modules: Iterable[KotInjectionModule]):
         """Load additional modules into the container.
 
         This method allows dynamically adding new dependency definitions
@@ -115,7 +131,7 @@ class KotInjectionCore:
         marked with `created_at_start=True` will be eagerly initialized.
 
         Args:
-            modules: List of KotInjectionModule instances to load
+            modules: KotInjectionModule instances (any iterable) to load
 
         Raises:
             ContainerClosedError: When the container has been closed
@@ -133,14 +149,14 @@ class KotInjectionCore:
         self._container.load_modules(modules)
         self._container.eager_initialize()
 
-    def unload_modules(self, modules: List[KotInjectionModule]):
+    def unload_modules(self, modules: Iterable[KotInjectionModule]):
         """Unload modules from the container.
 
         This method removes dependency definitions that were loaded
         from the specified modules.
 
         Args:
-            modules: List of KotInjectionModule instances to unload
+            modules: KotInjectionModule instances (any iterable) to unload
 
         Raises:
             ContainerClosedError: When the container has been closed
@@ -161,6 +177,10 @@ class KotInjectionCore:
 
         This method is idempotent - calling it multiple times has no effect.
 
+        The internal container is cleared, so singletons and other objects
+        referenced only by this container are released immediately instead
+        of at the next garbage collection.
+
         Note:
             Future versions may add disposal of singleton instances
             (e.g., calling close() on database connections).
@@ -171,9 +191,10 @@ class KotInjectionCore:
             # ... use the container ...
             app.close()  # Cleanup
         """
-        if not self._closed:
-            self._closed = True
+        if self.get is not _CLOSED_CONTAINER:
+            self.get = _CLOSED_CONTAINER  # type: ignore[assignment]
             # Future: dispose singleton instances here
+            self._container.clear()
 
     @property
     def is_closed(self) -> bool:
@@ -189,7 +210,7 @@ class KotInjectionCore:
             app.close()
             print(app.is_closed)  # True
         """
-        return self._closed
+        return self.get is _CLOSED_CONTAINER
 
     def __enter__(self) -> 'KotInjectionCore':
         """Enter context manager.
@@ -205,16 +226,14 @@ class KotInjectionCore:
         """
         return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Exit context manager and close the container.
 
+        Exceptions raised inside the ``with`` block are not suppressed.
+
         Args:
             exc_type: Exception type if an exception was raised
             exc_val: Exception value if an exception was raised
             exc_tb: Exception traceback if an exception was raised
-
-        Returns:
-            False (exceptions are not suppressed)
         """
         self.close()
-        return False
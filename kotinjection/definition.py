@@ -4,19 +4,97 @@ Definition
 Data class representing dependency definitions
 """
 
-from dataclasses import dataclass
-from typing import Type, Callable, List, Optional, Any
+from abc import ABC
+from dis import hasjabs, hasjrel, opmap
+from dataclasses import dataclass, field
+from types import CodeType
+from typing import Type, Callable, Optional, Any, Tuple
 
 from .lifecycle import KotInjectionLifeCycle
 
+# Opcodes that call a Python object (CALL_FUNCTION/CALL_METHOD up to 3.10,
+# PRECALL/CALL from 3.11, CALL_KW from 3.13, CALL_FUNCTION_EX throughout)
+_CALL_OPCODES = frozenset(
+    op for name, op in opmap.items() if name.startswith('CALL') or name == 'PRECALL'
+)
 
-@dataclass
+
+# Opcodes that jump (conditionals, boolean operators, loops)
+_JUMP_OPCODES = frozenset(hasjrel) | frozenset(hasjabs)
+
+
+def _factory_code_uses(factory: Callable, opcodes: frozenset) -> bool:
+    """Check whether a factory's bytecode contains any of the given opcodes.
+
+    Nested functions and comprehensions are scanned as well. Callables
+    without Python bytecode (partials, callable objects, builtins) are
+    conservatively assumed to contain them.
+    """
+    code = getattr(factory, '__code__', None)
+    if not isinstance(code, CodeType):
+        return True
+
+    pending = [code]
+    while pending:
+        code = pending.pop()
+        # Wordcode: every even byte is an opcode
+        if not opcodes.isdisjoint(code.co_code[::2]):
+            return True
+        pending.extend(c for c in code.co_consts if isinstance(c, CodeType))
+    return False
+
+
+def _factory_may_call_get(factory: Callable) -> bool:
+    """Check whether a factory may call module.get() / container.get().
+
+    A factory can only reach get() - directly, through an alias or through a
+    helper function - by making a call, so this only returns False when the
+    factory's bytecode, including nested functions and comprehensions,
+    contains no call instruction at all (e.g. ``lambda: config``).
+
+    Note:
+        Code run implicitly, such as a property getter or an operator
+        method, is not seen by this check.
+    """
+    return _factory_code_uses(factory, _CALL_OPCODES)
+
+
+def _factory_may_branch(factory: Callable) -> bool:
+    """Check whether a factory may pick its implementation class at runtime.
+
+    Returns True when the factory's bytecode contains a jump, as in
+    ``lambda: B(m.get()) if flag else A(m.get())``. Such factories are
+    dry-run on every resolution instead of reusing parameter types.
+    """
+    return _factory_code_uses(factory, _JUMP_OPCODES)
+
+
+@dataclass(slots=True, eq=False)
 class Definition:
     """Dependency definition"""
     interface: Type
     factory: Callable
     lifecycle: KotInjectionLifeCycle
-    parameter_types: Optional[List[Type]] = None  # Lazily resolved parameter types
+    parameter_types: Optional[Tuple[Type, ...]] = None  # Lazily resolved parameter types (shared)
     implementation_type: Optional[Type] = None  # Cached implementation type
     instance: Optional[Any] = None
     created_at_start: bool = False  # Eager initialization flag
+    _is_singleton: bool = field(init=False, repr=False, compare=False)  # Precomputed lifecycle check
+    _skip_validation: bool = field(init=False, repr=False, compare=False)  # ABC/Protocol interface
+    _needs_dry_run: bool = field(init=False, repr=False, compare=False)  # Factory may call get()
+    _stable_impl: bool = field(init=False, repr=False, compare=False)  # Always the same implementation
+
+    def __post_init__(self):
+        self._is_singleton = self.lifecycle is KotInjectionLifeCycle.SINGLETON
+        # Abstract interfaces are implemented by subclasses, so the factory's
+        # return type is not checked against them
+        interface = self.interface
+        self._skip_validation = hasattr(interface, '__abstractmethods__') or (
+            isinstance(interface, type) and issubclass(interface, ABC)
+        )
+        # Factories that make no calls cannot call get() and need no
+        # parameter types, so the dry-run used to discover them can be skipped
+        self._needs_dry_run = _factory_may_call_get(self.factory)
+        # Assumed until the factory returns a different implementation class,
+        # unless the factory has branches that may select another class
+        self._stable_impl = not _factory_may_branch(self.factory)
@@ -15,8 +15,12 @@ the specific lifecycle behaviors.
 
 import ast
 import inspect
+import re
 import typing
-from typing import Type, TypeVar, Callable, List, Optional, Dict, Any, TYPE_CHECKING, Union
+from collections import ChainMap
+from functools import lru_cache
+from types import CodeType, MappingProxyType
+from typing import Type, TypeVar, Callable, Iterable, List, Optional, Dict, Mapping, Any, Tuple, TYPE_CHECKING, Union
 
 from .exceptions import TypeInferenceError
 from .lifecycle import KotInjectionLifeCycle
@@ -47,6 +51,8 @@ class DefinitionBuilder:
         via module.single or module.factory instead.
     """
 
+    __slots__ = ("module", "lifecycle", "_is_singleton", "_registers")
+
     def __init__(self, module: 'KotInjectionModule', lifecycle: KotInjectionLifeCycle):
         """Initialize the builder with a module and lifecycle.
 
@@ -56,6 +62,10 @@ class DefinitionBuilder:
         """
         self.module = module
         self.lifecycle = lifecycle
+        # The lifecycle is fixed per builder, so check it once here
+        self._is_singleton = lifecycle is KotInjectionLifeCycle.SINGLETON
+        # Registration functions returned by builder[Type], memoized per type
+        self._registers: Dict[Type, Callable[..., None]] = {}
 
     def __getitem__(self, interface: Type[T]) -> Callable[..., None]:
         """Enable subscript syntax: builder[Type](factory) or builder[Type](impl_type).
@@ -84,53 +94,153 @@ class DefinitionBuilder:
             # Is equivalent to:
             register = module.single[Database]
             register(lambda: Database())
+
+        Note:
+            The returned function only binds the builder and the type, so
+            it is created once per type and reused by later subscripts.
         """
+        cached = self._registers.get(interface)
+        if cached is not None:
+            return cached
 
         def register(
             factory_or_type: Union[Callable[[], T], Type[T]],
             created_at_start: Optional[bool] = None
         ) -> None:
-            # Determine effective created_at_start value:
-            # - If explicitly specified at definition level, use that
-            # - Otherwise, inherit from module's default
-            # - Only applies to SINGLETON lifecycle
-            effective_created_at_start = (
-                created_at_start if created_at_start is not None
-                else self.module._created_at_start
-            ) if self.lifecycle == KotInjectionLifeCycle.SINGLETON else False
-
-            # Check if factory_or_type is a Type (class) or Callable (factory)
-            if isinstance(factory_or_type, type):
-                # Type was passed - create auto-factory that resolves dependencies
-                impl_type = factory_or_type
-                module_ref = self.module
-
-                def auto_factory(implementation: Type[T] = impl_type) -> T:
-                    """Auto-generated factory that resolves dependencies from __init__."""
-                    param_types = DefinitionBuilder._get_parameter_types(implementation)
-                    args = [module_ref.get[t]() for t in param_types]
-                    return implementation(*args)
-
-                factory = auto_factory
-            else:
-                # Callable was passed - use as-is
-                factory = factory_or_type
-
-            # No pre-analysis - parameter types will be resolved lazily
-            # at resolution time by executing the factory in dry-run mode
-            definition = Definition(
-                interface=interface,
-                factory=factory,
-                lifecycle=self.lifecycle,
-                created_at_start=effective_created_at_start,
-                # parameter_types will be populated during first resolution
+            self.module.add_definition(
+                self._create_definition(interface, factory_or_type, created_at_start)
             )
-            self.module.add_definition(definition)
 
+        self._registers[interface] = register
         return register
 
+    def register_many(
+        self,
+        registrations: Iterable[Tuple[Type, Union[Callable[[], Any], Type]]],
+        created_at_start: Optional[bool] = None
+    ) -> None:
+        """Register several definitions with one module update.
+
+        Equivalent to calling builder[interface](factory_or_type) for each
+        pair in order, but the definitions are built first and added to
+        the module in a single batch.
+
+        Args:
+            registrations: (interface, factory_or_type) pairs to register
+            created_at_start: Applied to every registration, as for
+                builder[Type](..., created_at_start=...)
+
+        Example::
+
+            with module:
+                module.single.register_many([
+                    (Database, lambda: Database()),
+                    (IRepository, Repository),
+                ])
+        """
+        create = self._create_definition
+        self.module.add_definitions([
+            create(interface, factory_or_type, created_at_start)
+            for interface, factory_or_type in registrations
+        ])
+
+    def _create_definition(
+        self,
+        interface: Type[T],
+        factory_or_type: Union[Callable[[], T], Type[T]],
+        created_at_start: Optional[bool]
+    ) -> Definition:
+        """Build the Definition for one registration.
+
+        Args:
+            interface: The type being registered
+            factory_or_type: Factory callable or implementation type
+            created_at_start: Definition-level eager initialization flag,
+                or None to inherit the module's default
+
+        Returns:
+            The new Definition (not yet added to the module)
+        """
+        # Determine effective created_at_start value:
+        # - If explicitly specified at definition level, use that
+        # - Otherwise, inherit from module's default
+        # - Only applies to SINGLETON lifecycle
+        if not self._is_singleton:
+            effective_created_at_start = False
+        elif created_at_start is not None:
+            effective_created_at_start = created_at_start
+        else:
+            effective_created_at_start = self.module._created_at_start
+
+        # Check if factory_or_type is a Type (class) or Callable (factory)
+        if isinstance(factory_or_type, type):
+            # Type was passed - create auto-factory that resolves dependencies
+            impl_type = factory_or_type
+            module_ref = self.module
+            getters: Optional[List[Callable[[], Any]]] = None
+
+            def auto_factory() -> T:
+                """Auto-generated factory that resolves dependencies from __init__.
+
+                The constructor is analyzed on the first call only; the
+                resulting getters are reused afterwards.
+                """
+                nonlocal getters
+                if getters is None:
+                    param_types = DefinitionBuilder._get_parameter_types(impl_type)
+                    getters = [module_ref.get[t] for t in param_types]
+                return impl_type(*[getter() for getter in getters])
+
+            factory = auto_factory
+        else:
+            # Callable was passed - use as-is
+            impl_type = None
+            factory = factory_or_type
+
+        # No pre-analysis - parameter types will be resolved lazily
+        # at resolution time by executing the factory in dry-run mode
+        definition = Definition(
+            interface=interface,
+            factory=factory,
+            lifecycle=self.lifecycle,
+            created_at_start=effective_created_at_start,
+            # parameter_types will be populated during first resolution
+        )
+        if impl_type is not None:
+            # The auto-factory resolves every argument by explicit type,
+            # so the implementation is known and no dry-run is needed
+            definition.implementation_type = impl_type
+            definition._needs_dry_run = False
+        return definition
+
     @staticmethod
-    def _get_parameter_types(cls: Type) -> List[Type]:
+    def _get_parameter_types(cls: Type) -> Tuple[Type, ...]:
+        """Extract parameter types from a class constructor, cached per class.
+
+        Returns the result of _analyze_parameter_types(), memoized per class
+        in a bounded LRU cache. Failed analyses raise and are not
+        cached, so a forward reference that becomes resolvable later is
+        picked up on the next call.
+
+        Args:
+            cls: The class to analyze
+
+        Returns:
+            Tuple of parameter types from the class constructor,
+            excluding 'self', *args, and **kwargs
+
+        Raises:
+            TypeInferenceError: When type hints are missing, inspection fails,
+                or the class is not inspectable (e.g., built-in types)
+        """
+        try:
+            return _cached_parameter_types(cls)
+        except TypeError:
+            # Unhashable class (metaclass defines __eq__ without __hash__)
+            return tuple(DefinitionBuilder._analyze_parameter_types(cls))
+
+    @staticmethod
+    def _analyze_parameter_types(cls: Type) -> List[Type]:
         """Extract parameter types from a class constructor.
 
         Analyzes the __init__ method signature to extract type hints
@@ -149,8 +259,7 @@ class DefinitionBuilder:
                 or the class is not inspectable (e.g., built-in types)
 
         Note:
-            This analysis is performed at registration time, not resolution time,
-            for better performance during dependency resolution.
+            Use _get_parameter_types() instead, which caches the result.
         """
         if cls is None:
             raise TypeInferenceError(
@@ -159,39 +268,58 @@ class DefinitionBuilder:
             )
 
         try:
-            sig = inspect.signature(cls.__init__)
-        except ValueError as e:
+            sig = _cached_signature(cls)
+        except TypeError:
+            # Unhashable class - inspect without the cache
+            sig = _inspect_signature(cls)
+
+        if isinstance(sig, ValueError):
             raise TypeInferenceError(
-                f"Cannot inspect {cls.__name__}.__init__: {e}. "
+                f"Cannot inspect {cls.__name__}.__init__: {sig}. "
                 f"This may occur with built-in types or C extension classes."
-            ) from e
-        except TypeError as e:
+            ) from sig
+        if isinstance(sig, TypeError):
             raise TypeInferenceError(
-                f"Cannot get signature for {cls.__name__}.__init__: {e}. "
+                f"Cannot get signature for {cls.__name__}.__init__: {sig}. "
                 f"Ensure {cls.__name__} is a class with a valid constructor."
-            ) from e
+            ) from sig
+
+        # Skip 'self', *args and **kwargs (VAR_POSITIONAL and VAR_KEYWORD)
+        empty = inspect.Parameter.empty
+        var_kinds = (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+        params = [
+            param for param_name, param in sig.parameters.items()
+            if param_name != 'self' and param.kind not in var_kinds
+        ]
+
+        # Fast path: every annotation is already a class, so there is
+        # nothing for typing.get_type_hints() to resolve. A None default is
+        # excluded because get_type_hints() wraps it in Optional[] before
+        # Python 3.11.
+        if all(
+            isinstance(param.annotation, type)
+            and param.annotation is not empty
+            and param.default is not None
+            for param in params
+        ):
+            return [param.annotation for param in params]
 
         # Try to resolve type hints using typing.get_type_hints()
         # This handles forward references (string annotations) and PEP 563
         resolved_hints = DefinitionBuilder._resolve_type_hints(cls)
 
         parameter_types = []
-        for param_name, param in sig.parameters.items():
-            if param_name == 'self':
-                continue
-
-            # Skip *args and **kwargs (VAR_POSITIONAL and VAR_KEYWORD)
-            if param.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
-                continue
-
-            if param.annotation == inspect.Parameter.empty:
+        for param in params:
+            param_name = param.name
+            annotation = param.annotation
+            if annotation is empty:
                 raise TypeInferenceError(
                     f"Missing type hint for parameter '{param_name}' in {cls.__name__}.__init__. "
                     f"Type inference requires type hints for all parameters."
                 )
 
             # Get resolved type from hints, fallback to raw annotation
-            param_type = resolved_hints.get(param_name, param.annotation)
+            param_type = resolved_hints.get(param_name, annotation)
 
             # If still a string, attempt manual resolution
             if isinstance(param_type, str):
@@ -204,38 +332,38 @@ class DefinitionBuilder:
         return parameter_types
 
     @staticmethod
-    def _resolve_type_hints(cls: Type) -> Dict[str, Any]:
+    def _resolve_type_hints(cls: Type) -> Mapping[str, Any]:
         """Resolve type hints for a class using typing.get_type_hints().
 
         This method attempts to resolve forward references (string annotations)
         to actual types. It handles various failure scenarios gracefully by
-        returning an empty dict, allowing fallback to manual resolution.
+        returning an empty mapping, allowing fallback to manual resolution.
+        Successful results are cached per class; failures are not, so a
+        forward reference defined later is picked up on the next call.
 
         Args:
             cls: The class to resolve type hints for
 
         Returns:
-            Dictionary mapping parameter names to resolved types.
-            Returns empty dict if resolution fails.
+            Read-only mapping of parameter names to resolved types.
+            Returns an empty mapping if resolution fails.
         """
         try:
-            # include_extras=True preserves Annotated[] metadata (Python 3.11+)
-            hints = typing.get_type_hints(cls.__init__, include_extras=True)
-            return hints
+            return _cached_type_hints(cls)
         except NameError:
             # Type not found in scope - common with local classes
-            return {}
+            return _EMPTY_HINTS
         except RecursionError:
             # Circular import or self-referencing type
-            return {}
+            return _EMPTY_HINTS
         except TypeError:
             # PEP 604 | operator used with a type that doesn't support it
             # (e.g., multiprocessing.Queue which is a method, not a class)
             # Fall back to manual string annotation resolution
-            return {}
+            return _EMPTY_HINTS
         except Exception:
             # Any other error - fall back to raw annotations
-            return {}
+            return _EMPTY_HINTS
 
     @staticmethod
     def _resolve_string_annotation(
@@ -270,29 +398,25 @@ class DefinitionBuilder:
                 f"explicit imports."
             )
 
-        # Build namespace from module's globals
-        namespace: Dict[str, Any] = {}
-        if hasattr(module, '__dict__'):
-            namespace.update(module.__dict__)
-
-        # Also check class's own namespace (for nested classes)
-        if hasattr(cls, '__dict__'):
-            namespace.update(cls.__dict__)
-
-        # Add typing constructs to namespace for Union conversion
-        if 'Union' not in namespace:
-            namespace['Union'] = Union
-        if 'Optional' not in namespace:
-            namespace['Optional'] = Optional
-
-        # Convert PEP 604 union syntax (X | Y) to Union[X, Y] before evaluation
-        # This is necessary because some types (like multiprocessing.Queue)
-        # don't support the | operator
-        converted_annotation = DefinitionBuilder._convert_union_syntax(annotation)
-
-        # Try to evaluate the annotation in the namespace
+        # Look names up in the class's own namespace (for nested classes),
+        # then the module's globals, then the typing constructs needed for
+        # Union conversion - without copying either namespace
+        module_globals: Dict[str, Any] = getattr(module, '__dict__', {})
+        namespace = ChainMap(
+            getattr(cls, '__dict__', {}), module_globals, _ANNOTATION_TYPING_NAMES
+        )
+
+        # Fast path: a bare identifier is a plain namespace lookup
+        if annotation.isidentifier():
+            resolved = namespace.get(annotation)
+            if resolved is not None:
+                return resolved
+
+        # Try to evaluate the annotation in the namespace.
+        # PEP 604 union syntax (X | Y) is compiled as Union[X, Y], because
+        # some types (like multiprocessing.Queue) don't support the | operator
         try:
-            resolved_type = eval(converted_annotation, namespace)
+            resolved_type = eval(_compile_annotation(annotation), module_globals, namespace)
             return resolved_type
         except NameError:
             raise TypeInferenceError(
@@ -314,70 +438,12 @@ class DefinitionBuilder:
                 f"'{param_name}' in {cls.__name__}.__init__: {e}."
             ) from e
 
-    @staticmethod
-    def _convert_union_syntax(annotation: str) -> str:
-        """Convert PEP 604 union syntax (X | Y) to typing.Union[X, Y].
-
-        This method uses the ast module to safely parse and transform
-        pipe-style union syntax to the traditional Union[] syntax.
-        This is necessary because some types (like multiprocessing.Queue)
-        are methods/functions that don't support the | operator.
-
-        Args:
-            annotation: The annotation string to convert
-
-        Returns:
-            The converted annotation string using Union[] syntax.
-            Returns the original if no conversion is needed or parsing fails.
-
-        Example::
-
-            >>> DefinitionBuilder._convert_union_syntax('int | str')
-            'Union[int, str]'
-            >>> DefinitionBuilder._convert_union_syntax('multiprocessing.Queue | None')
-            'Union[multiprocessing.Queue, None]'
-        """
-        # Quick check: if no pipe operator, return as-is
-        if '|' not in annotation:
-            return annotation
-
-        try:
-            tree = ast.parse(annotation, mode='eval')
-        except SyntaxError:
-            # Invalid syntax - return original and let eval() handle the error
-            return annotation
-
-        class UnionTransformer(ast.NodeTransformer):
-            """Transform BinOp(|) nodes to Subscript(Union[...]) nodes."""
-
-            def visit_BinOp(self, node: ast.BinOp) -> ast.AST:
-                if isinstance(node.op, ast.BitOr):
-                    # Collect all types in the union chain BEFORE transforming children
-                    # This ensures X | Y | Z becomes Union[X, Y, Z] not Union[Union[X, Y], Z]
-                    types = DefinitionBuilder._collect_union_types(node)
-                    # Now transform each collected type (for nested unions inside generics)
-                    transformed_types = [self.visit(t) for t in types]
-                    return ast.Subscript(
-                        value=ast.Name(id='Union', ctx=ast.Load()),
-                        slice=ast.Tuple(elts=transformed_types, ctx=ast.Load()),
-                        ctx=ast.Load()
-                    )
-                # For non-BitOr BinOp, use default behavior
-                self.generic_visit(node)
-                return node
-
-        transformer = UnionTransformer()
-        new_tree = transformer.visit(tree)
-        ast.fix_missing_locations(new_tree)
-
-        return ast.unparse(new_tree.body)
-
     @staticmethod
     def _collect_union_types(node: ast.BinOp) -> List[ast.AST]:
         """Collect all types from a chain of | operators.
 
-        Recursively traverses nested BinOp nodes with BitOr operators
-        to flatten the union chain into a list.
+        Walks nested BinOp nodes with BitOr operators using an explicit
+        stack to flatten the union chain into a list, left to right.
 
         Args:
             node: The BinOp AST node to collect types from
@@ -390,13 +456,137 @@ class DefinitionBuilder:
             For 'int | str | None', returns AST nodes for [int, str, None]
         """
         types: List[ast.AST] = []
-
-        def collect(n: ast.AST) -> None:
+        stack: List[ast.AST] = [node]
+        while stack:
+            n = stack.pop()
             if isinstance(n, ast.BinOp) and isinstance(n.op, ast.BitOr):
-                collect(n.left)
-                collect(n.right)
+                # Push right first so the left operand is visited first
+                stack.append(n.right)
+                stack.append(n.left)
             else:
                 types.append(n)
-
-        collect(node)
         return types
+
+
+class _UnionTransformer(ast.NodeTransformer):
+    """Transform BinOp(|) nodes to Subscript(Union[...]) nodes."""
+
+    def visit_BinOp(self, node: ast.BinOp) -> ast.AST:
+        if isinstance(node.op, ast.BitOr):
+            # Collect all types in the union chain BEFORE transforming children
+            # This ensures X | Y | Z becomes Union[X, Y, Z] not Union[Union[X, Y], Z]
+            types = DefinitionBuilder._collect_union_types(node)
+            # Now transform each collected type (for nested unions inside generics)
+            transformed_types = [self.visit(t) for t in types]
+            return ast.Subscript(
+                value=ast.Name(id='Union', ctx=ast.Load()),
+                slice=ast.Tuple(elts=transformed_types, ctx=ast.Load()),
+                ctx=ast.Load()
+            )
+        # For non-BitOr BinOp, use default behavior
+        self.generic_visit(node)
+        return node
+
+
+def _convert_union_tree(tree: ast.Expression) -> ast.Expression:
+    """Rewrite PEP 604 unions in a parsed annotation to Union[...] in place."""
+    new_tree = _UnionTransformer().visit(tree)
+    ast.fix_missing_locations(new_tree)
+    return new_tree
+
+
+def _has_union_operator(node: ast.AST) -> bool:
+    """Check whether a parsed annotation contains a | operator."""
+    return any(
+        isinstance(n, ast.BinOp) and isinstance(n.op, ast.BitOr)
+        for n in ast.walk(node)
+    )
+
+
+def _may_contain_union(annotation: str) -> bool:
+    """Check whether an annotation string may contain a | union operator.
+
+    Pipes that only occur inside string literals (e.g. Literal['a|b'])
+    are not union operators.
+    """
+    if '|' not in annotation:
+        return False
+    if (
+        ("'" in annotation or '"' in annotation)
+        and '\\' not in annotation
+        and '|' not in _STRING_LITERAL_RE.sub('', annotation)
+    ):
+        return False
+    return True
+
+
+_EMPTY_HINTS: Mapping[str, Any] = MappingProxyType({})
+
+# Single- or double-quoted string literal without escapes (annotations
+# containing a backslash skip the pre-check and go through ast.parse)
+_STRING_LITERAL_RE = re.compile(r"'[^']*'|\"[^\"]*\"")
+
+_ANNOTATION_TYPING_NAMES: Mapping[str, Any] = MappingProxyType(
+    {'Union': Union, 'Optional': Optional}
+)
+
+
+@lru_cache(maxsize=512)
+def _compile_annotation(expr: str) -> CodeType:
+    """Compile an annotation expression once for repeated eval().
+
+    PEP 604 unions (X | Y) are rewritten to Union[X, Y] on the parsed tree,
+    which is compiled directly instead of being unparsed and parsed again.
+
+    Raises:
+        SyntaxError: When the expression is not valid Python
+    """
+    if not _may_contain_union(expr):
+        return compile(expr, '<annotation>', 'eval')
+
+    tree = ast.parse(expr, mode='eval')
+    if _has_union_operator(tree.body):
+        tree = _convert_union_tree(tree)
+    return compile(tree, '<annotation>', 'eval')
+
+
+# Maximum number of classes kept by each per-class analysis cache. The caches
+# hold strong references, so they are bounded to let classes created at
+# runtime be freed once they fall out of the cache.
+_TYPE_CACHE_SIZE = 1024
+
+
+def _inspect_signature(cls: Type) -> Union[inspect.Signature, ValueError, TypeError]:
+    """Return inspect.signature(cls.__init__), or the exception it raised.
+
+    Failures are returned rather than raised so that _cached_signature
+    remembers them and repeated attempts don't go through inspect again.
+    """
+    try:
+        return inspect.signature(cls.__init__)
+    except (ValueError, TypeError) as e:
+        return e
+
+
+_cached_signature = lru_cache(maxsize=_TYPE_CACHE_SIZE)(_inspect_signature)
+
+
+@lru_cache(maxsize=_TYPE_CACHE_SIZE)
+def _cached_type_hints(cls: Type) -> Mapping[str, Any]:
+    """Memoized typing.get_type_hints() backing DefinitionBuilder._resolve_type_hints."""
+    # include_extras=True preserves Annotated[] metadata (Python 3.11+)
+    return MappingProxyType(typing.get_type_hints(cls.__init__, include_extras=True))
+
+
+@lru_cache(maxsize=_TYPE_CACHE_SIZE)
+def _cached_parameter_types(cls: Type) -> Tuple[Type, ...]:
+    """Memoized constructor analysis backing DefinitionBuilder._get_parameter_types."""
+    return tuple(DefinitionBuilder._analyze_parameter_types(cls))
+
+
+def _clear_type_cache() -> None:
+    """Clear the per-class constructor analysis caches (for tests)."""
+    _cached_parameter_types.cache_clear()
+    _cached_signature.cache_clear()
+    _cached_type_hints.cache_clear()
+    _compile_annotation.cache_clear()
@@ -12,16 +12,23 @@ class DryRunPlaceholder:
     Placeholder for dry-run factory execution.
 
     This class accepts any method call or attribute access,
-    always returning a new placeholder instance.
+    always returning a placeholder. It holds no state, so instances have
+    no __dict__, attribute assignments are ignored, and the shared
+    _DRY_RUN_PLACEHOLDER instance is returned instead of a new one.
     """
 
+    __slots__ = ()
+
     def __getattr__(self, name: str) -> "DryRunPlaceholder":
         """Accept any attribute access."""
-        return DryRunPlaceholder()
+        return _DRY_RUN_PLACEHOLDER
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Accept any attribute assignment."""
 
     def __call__(self, *args: Any, **kwargs: Any) -> "DryRunPlaceholder":
         """Accept any method call."""
-        return DryRunPlaceholder()
+        return _DRY_RUN_PLACEHOLDER
 
     def __repr__(self) -> str:
         return "<DryRunPlaceholder>"
@@ -46,3 +53,7 @@ class DryRunPlaceholder:
 
     def __exit__(self, *args: Any) -> None:
         pass
+
+
+# Shared instance handed out during dry-runs (placeholders are stateless)
+_DRY_RUN_PLACEHOLDER = DryRunPlaceholder()
@@ -16,5 +16,7 @@ if TYPE_CHECKING:
 class FactoryBuilder(DefinitionBuilder):
     """Builder for factory definitions"""
 
+    __slots__ = ()
+
     def __init__(self, module: 'KotInjectionModule'):
         super().__init__(module, KotInjectionLifeCycle.FACTORY)
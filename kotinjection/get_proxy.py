@@ -14,12 +14,13 @@ Instead of:
     service = KotInjection.get(MyService)
 """
 
-from typing import Callable, Optional, Type, TypeVar, TYPE_CHECKING
+from functools import partial
+from typing import Callable, Type, TypeVar, TYPE_CHECKING
 
 from .exceptions import NotInitializedError
 
 if TYPE_CHECKING:
-    from .core import KotInjectionCore
+    from .context import KotInjectionContext
 
 T = TypeVar('T')
 
@@ -31,29 +32,39 @@ class KotInjectionGetProxy:
     retrieval without using a metaclass. It is used as a class attribute
     on KotInjection.
 
-    The proxy holds a function that retrieves the current KotInjectionCore
-    instance, allowing it to delegate to the active container.
+    The proxy holds a function that returns the current KotInjectionContext,
+    so reassigning the context takes effect immediately. It reads the
+    KotInjectionCore the context caches, falling back to ``get_or_null()``
+    when the context does not cache one, and resolves through the app's
+    ``get`` attribute so a closed app raises ContainerClosedError.
+
+    The callable returned by ``get[Type]`` is a ``functools.partial`` bound
+    directly to the container's ``get`` method, so invoking it does not
+    enter an intermediate Python frame.
 
     Attributes:
-        _get_app: Function that returns the current KotInjectionCore instance
+        _get_context: Function that returns the context holding the
+            current KotInjectionCore instance
 
     Example::
 
         # The proxy is used internally like this:
-        KotInjection.get = KotInjectionGetProxy(lambda: KotInjection._context.get_or_null())
+        KotInjection.get = KotInjectionGetProxy(lambda: KotInjection._context)
 
         # Users can then do:
         service = KotInjection.get[MyService]()
     """
 
-    def __init__(self, get_app_func: Callable[[], Optional['KotInjectionCore']]):
-        """Initialize the proxy with an app getter function.
+    __slots__ = ("_get_context",)
+
+    def __init__(self, get_context_func: Callable[[], 'KotInjectionContext']):
+        """Initialize the proxy with a context getter function.
 
         Args:
-            get_app_func: A callable that returns the current KotInjectionCore
-                instance, or None if not initialized
+            get_context_func: A callable that returns the KotInjectionContext
+                whose active container should be used for resolution
         """
-        self._get_app = get_app_func
+        self._get_context = get_context_func
 
     def __getitem__(self, interface: Type[T]) -> Callable[[], T]:
         """Enable subscript access for type-safe dependency retrieval.
@@ -82,7 +93,10 @@ class KotInjectionGetProxy:
             # Is equivalent to:
             service = KotInjection.get[MyService]()
         """
-        app = self._get_app()
+        context = self._get_context()
+        app = context._cached_app
         if app is None:
-            raise NotInitializedError("KotInjection.start() must be called first")
-        return app.get[interface]
+            app = context.get_or_null()
+            if app is None:
+                raise NotInitializedError("KotInjection.start() must be called first")
+        return partial(app.get.get, interface)
@@ -17,7 +17,7 @@ Example::
     context.stop()
 """
 
-from typing import List, Optional
+from typing import Iterable, Optional
 
 from .context import KotInjectionContext
 from .core import KotInjectionCore
@@ -37,6 +37,9 @@ class GlobalContext(KotInjectionContext):
 
     Attributes:
         _app: The global KotInjectionCore instance (None if not started)
+        _cached_app: Same as ``_app``, written by start() and cleared by
+            stop() so proxies can read it directly
+        _started: True between a successful start() and the next stop()
 
     Example::
 
@@ -53,26 +56,19 @@ class GlobalContext(KotInjectionContext):
 
     _instance: Optional['GlobalContext'] = None
     _app: Optional[KotInjectionCore]
+    _cached_app: Optional[KotInjectionCore]
+    _started: bool
 
     def __new__(cls) -> 'GlobalContext':
         """Ensure singleton instance.
 
+        The instance is created once when this module is imported, and
+        there is no __init__ to run again on later GlobalContext() calls.
+
         Returns:
             The single GlobalContext instance
         """
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._app = None
-        return cls._instance
-
-    def __init__(self):
-        """Initialize the global context.
-
-        Note: Due to singleton pattern, this may be called multiple times
-        but will not reinitialize the instance.
-        """
-        # Avoid re-initialization on subsequent __init__ calls
-        pass
+        return _GLOBAL_CONTEXT
 
     def get(self) -> KotInjectionCore:
         """Get the current KotInjectionCore instance.
@@ -97,14 +93,14 @@ class GlobalContext(KotInjectionContext):
         """
         return self._app
 
-    def start(self, modules: List[KotInjectionModule]) -> KotInjectionCore:
+    def start(self, modules: Iterable[KotInjectionModule]) -> KotInjectionCore:
         """Start the global context with given modules.
 
         Creates a new KotInjectionCore instance and stores it as the
         global container.
 
         Args:
-            modules: List of KotInjectionModule instances to load
+            modules: KotInjectionModule instances (any iterable) to load
 
         Returns:
             The created KotInjectionCore instance
@@ -118,6 +114,8 @@ class GlobalContext(KotInjectionContext):
                 "Call KotInjection.stop() before starting again."
             )
         self._app = KotInjectionCore(modules=modules)
+        self._cached_app = self._app
+        self._started = True
         return self._app
 
     def stop(self) -> None:
@@ -126,15 +124,17 @@ class GlobalContext(KotInjectionContext):
         Closes the current container and resets to uninitialized state.
         This method is idempotent - calling it multiple times has no effect.
         """
+        self._started = False
         if self._app is not None:
+            self._cached_app = None
             self._app.close()
             self._app = None
 
-    def load_modules(self, modules: List[KotInjectionModule]) -> None:
+    def load_modules(self, modules: Iterable[KotInjectionModule]) -> None:
         """Load additional modules into the running context.
 
         Args:
-            modules: List of KotInjectionModule instances to load
+            modules: KotInjectionModule instances (any iterable) to load
 
         Raises:
             NotInitializedError: If KotInjection is not started
@@ -142,13 +142,26 @@ class GlobalContext(KotInjectionContext):
         """
         self.get().load_modules(modules)
 
-    def unload_modules(self, modules: List[KotInjectionModule]) -> None:
+    def unload_modules(self, modules: Iterable[KotInjectionModule]) -> None:
         """Unload modules from the running context.
 
         Args:
-            modules: List of KotInjectionModule instances to unload
+            modules: KotInjectionModule instances (any iterable) to unload
 
         Raises:
             NotInitializedError: If KotInjection is not started
         """
         self.get().unload_modules(modules)
+
+
+def _create_global_context() -> GlobalContext:
+    """Create the singleton GlobalContext instance in its stopped state."""
+    context = super(GlobalContext, GlobalContext).__new__(GlobalContext)
+    context._app = None
+    context._cached_app = None
+    context._started = False
+    GlobalContext._instance = context
+    return context
+
+
+_GLOBAL_CONTEXT = _create_global_context()
@@ -13,12 +13,13 @@ access that returns InjectDescriptor instances:
 This is similar to Koin's `by inject()` pattern in Kotlin.
 """
 
-from typing import Callable, Optional, Type, TypeVar, TYPE_CHECKING
+from typing import Callable, Type, TypeVar, TYPE_CHECKING
 
 from .inject_descriptor import InjectDescriptor
 from .exceptions import NotInitializedError, ContainerClosedError
 
 if TYPE_CHECKING:
+    from .context import KotInjectionContext
     from .core import KotInjectionCore
 
 T = TypeVar('T')
@@ -33,29 +34,30 @@ class KotInjectionInjectProxy:
     resolve dependencies on first access.
 
     Attributes:
-        _get_app: Function that returns the current KotInjectionCore instance
+        _get_context: Function that returns the context holding the
+            current KotInjectionCore instance
 
     Example::
 
         # The proxy is used internally like this:
-        KotInjection.inject = KotInjectionInjectProxy(
-            lambda: KotInjection._context.get_or_null()
-        )
+        KotInjection.inject = KotInjectionInjectProxy(lambda: KotInjection._context)
 
         # Users can then do:
         class MyService:
             repository = KotInjection.inject[UserRepository]
     """
 
-    def __init__(self, get_app_func: Callable[[], Optional['KotInjectionCore']]):
+    __slots__ = ("_get_context",)
+
+    def __init__(self, get_context_func: Callable[[], 'KotInjectionContext']):
         """
-        Initialize the proxy with an app getter function.
+        Initialize the proxy with a context getter function.
 
         Args:
-            get_app_func: A callable that returns the current KotInjectionCore
-                instance, or None if not initialized
+            get_context_func: A callable that returns the KotInjectionContext
+                whose active container should be used for resolution
         """
-        self._get_app = get_app_func
+        self._get_context = get_context_func
 
     def __getitem__(self, interface: Type[T]) -> InjectDescriptor[T]:
         """
@@ -81,16 +83,20 @@ class KotInjectionInjectProxy:
                     # Dependency resolved here on first access
                     return self.repository.fetch_data()
         """
-        get_app = self._get_app
+        get_context = self._get_context
 
         def get_container():
-            app = get_app()
+            context = get_context()
+            app = context._cached_app
             if app is None:
-                raise NotInitializedError(
-                    f"KotInjection.start() must be called before accessing "
-                    f"injected dependency '{interface.__name__}'"
-                )
-            return app._container
+                app = context.get_or_null()
+                if app is None:
+                    raise NotInitializedError(
+                        f"KotInjection.start() must be called before accessing "
+                        f"injected dependency '{interface.__name__}'"
+                    )
+            # A closed app's get raises ContainerClosedError on resolution
+            return app.get
 
         return InjectDescriptor(interface, get_container)
 
@@ -134,6 +140,8 @@ class IsolatedInjectProxy:
     a specific KotInjectionCore instance rather than the global container.
     """
 
+    __slots__ = ("_app",)
+
     def __init__(self, app: 'KotInjectionCore'):
         """
         Initialize the proxy with a specific container.
@@ -22,7 +22,7 @@ Example::
     KotInjection.start(modules=[module])
 """
 
-from typing import List, Any, Optional, Type, TypeVar
+from typing import Iterable, List, Any, Optional, Type, TypeVar
 
 from .resolution_context import _resolution_context
 from .definition import Definition
@@ -122,6 +122,20 @@ class KotInjectionModule:
         """
         self._definitions.append(definition)
 
+    def add_definitions(self, definitions: Iterable[Definition]) -> None:
+        """Add several definitions to the module at once.
+
+        Batch counterpart of add_definition(), used by
+        DefinitionBuilder.register_many().
+
+        Args:
+            definitions: The Definition objects to add, in order
+
+        Note:
+            Like add_definition(), this method does not check for duplicates.
+        """
+        self._definitions.extend(definitions)
+
     @property
     def get(self) -> ModuleGetProxy:
         """Get proxy for dependency resolution within factories.
@@ -224,8 +238,8 @@ class KotInjectionModule:
 
         # In dry-run mode, return a placeholder for type discovery
         if ctx.dry_run:
-            from .dry_run_placeholder import DryRunPlaceholder
-            return DryRunPlaceholder()
+            from .dry_run_placeholder import _DRY_RUN_PLACEHOLDER
+            return _DRY_RUN_PLACEHOLDER
 
         if ctx.container is None:
             raise NotInitializedError(
@@ -54,6 +54,8 @@ class ModuleGetProxy:
         config = module.get()
     """
 
+    __slots__ = ("_module",)
+
     def __init__(self, module: 'KotInjectionModule'):
         """Initialize the proxy with a reference to the module.
 
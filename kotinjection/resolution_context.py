@@ -14,7 +14,7 @@ automatically managed during dependency resolution.
 """
 
 from contextvars import ContextVar
-from typing import List, Optional, Set, Type, TYPE_CHECKING
+from typing import List, Optional, Sequence, Type, TYPE_CHECKING
 
 from .exceptions import ResolutionContextError
 
@@ -33,8 +33,10 @@ class ResolutionContext:
     - Holds a reference to the active container
 
     Attributes:
-        resolving: Set of types currently in the resolution chain
-        parameter_types: List of constructor parameter types for type inference
+        resolving: Types currently in the resolution chain, outermost first.
+            The list is shared by nested contexts and used as a stack.
+        parameter_types: Constructor parameter types for type inference
+            (a tuple shared with the container's cache)
         current_index: Current position in parameter_types for get() calls
         container: Reference to the container performing the resolution
         dry_run: Flag indicating dry-run mode for type discovery
@@ -56,14 +58,16 @@ class ResolutionContext:
         param2 = ctx.get_next_parameter_type()  # CacheService
     """
 
+    __slots__ = ('resolving', 'parameter_types', 'current_index', 'container', 'dry_run')
+
     def __init__(self):
         """Initialize an empty resolution context.
 
         Creates a context with no types being resolved and empty
         parameter type list. The container reference is initially None.
         """
-        self.resolving: Set[Type] = set()  # For circular dependency detection
-        self.parameter_types: List[Type] = []  # Parameter types currently being resolved
+        self.resolving: List[Type] = []  # For circular dependency detection
+        self.parameter_types: Sequence[Type] = ()  # Parameter types currently being resolved
         self.current_index: int = 0  # Call order of get()
         self.container: Optional['KotInjectionContainer'] = None  # Currently active container
         self.dry_run: bool = False  # Dry-run mode for type discovery
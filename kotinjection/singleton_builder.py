@@ -16,5 +16,7 @@ if TYPE_CHECKING:
 class SingletonBuilder(DefinitionBuilder):
     """Builder for singleton definitions"""
 
+    __slots__ = ()
+
     def __init__(self, module: 'KotInjectionModule'):
         super().__init__(module, KotInjectionLifeCycle.SINGLETON)
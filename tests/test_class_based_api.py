@@ -246,6 +246,29 @@ class TestKotInjectionErrorHandling(KotInjectionTestCase):
         with self.assertRaises(DuplicateDefinitionError):
             KotInjection.start(modules=[module1, module2])
 
+    def test_duplicate_registration_in_load_modules_registers_nothing(self):
+        """load_modules registers none of the modules when one is a duplicate"""
+        module1 = KotInjectionModule()
+        with module1:
+            module1.single[Database](lambda: Database())
+
+        KotInjection.start(modules=[module1])
+
+        module2 = KotInjectionModule()
+        with module2:
+            module2.single[CacheService](lambda: CacheService())
+
+        module3 = KotInjectionModule()
+        with module3:
+            module3.single[Database](lambda: Database())
+
+        with self.assertRaises(DuplicateDefinitionError):
+            KotInjection.load_modules([module2, module3])
+
+        # CacheService from module2 was not registered
+        with self.assertRaises(DefinitionNotFoundError):
+            KotInjection.get[CacheService]()
+
     def test_load_modules_after_start(self):
         """Loads modules after start"""
         module1 = KotInjectionModule()
@@ -302,6 +325,38 @@ class TestKotInjectionErrorHandling(KotInjectionTestCase):
         with self.assertRaises(DefinitionNotFoundError):
             KotInjection.get[CacheService]()
 
+    def test_unload_keeps_regular_modules_intact(self):
+        """Modules created directly keep their definitions after unloading"""
+        module = KotInjectionModule()
+        with module:
+            module.single[Database](lambda: Database())
+
+        KotInjection.start(modules=[module])
+        KotInjection.unload_modules([module])
+        self.assertEqual(len(module.definitions), 1)
+
+        KotInjection.load_modules([module])
+        self.assertIsNotNone(KotInjection.get[Database]())
+
+    def test_modules_accepted_as_any_iterable(self):
+        """start/load_modules/unload_modules accept generators and tuples"""
+        module1 = KotInjectionModule()
+        with module1:
+            module1.single[Database](lambda: Database())
+
+        module2 = KotInjectionModule()
+        with module2:
+            module2.single[CacheService](lambda: CacheService())
+
+        KotInjection.start(modules=(m for m in [module1]))
+        KotInjection.load_modules((module2,))
+        self.assertIsNotNone(KotInjection.get[CacheService]())
+
+        KotInjection.unload_modules(m for m in [module2])
+        with self.assertRaises(DefinitionNotFoundError):
+            KotInjection.get[CacheService]()
+        self.assertIsNotNone(KotInjection.get[Database]())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -430,6 +430,66 @@ class TestResourceCleanup(unittest.TestCase):
         with self.assertRaises(ContainerClosedError):
             app.load_modules([module])
 
+    def test_close_releases_singletons(self):
+        """A closed app no longer keeps singletons of discarded modules alive"""
+        import gc
+        import weakref
+
+        module = KotInjectionModule()
+        with module:
+            module.single[ServiceA](lambda: ServiceA())
+
+        app = KotInjectionCore(modules=[module])
+        service_ref = weakref.ref(app.get[ServiceA]())
+
+        app.close()
+        del module
+        gc.collect()
+
+        self.assertIsNone(service_ref())
+
+    def test_core_uses_slots(self):
+        """KotInjectionCore carries no __dict__ but can still be weakly referenced"""
+        import weakref
+
+        app = KotInjectionCore()
+        self.assertFalse(hasattr(app, '__dict__'))
+        self.assertIs(weakref.ref(app)(), app)
+        app.close()
+
+    def test_closed_container_rejects_any_get_access(self):
+        """After close, get[Type]() and container methods both raise"""
+        module = KotInjectionModule()
+        with module:
+            module.single[ServiceA](lambda: ServiceA())
+
+        app = KotInjectionCore(modules=[module])
+        self.assertIsInstance(app.get[ServiceA](), ServiceA)
+
+        app.close()
+
+        with self.assertRaises(ContainerClosedError):
+            app.get[ServiceA]()
+        with self.assertRaises(ContainerClosedError):
+            app.get.resolve(ServiceA)
+
+    def test_closed_container_can_be_copied(self):
+        """A closed container survives deepcopy and stays closed"""
+        import copy
+
+        module = KotInjectionModule()
+        with module:
+            module.single[ServiceA](lambda: ServiceA())
+
+        app = KotInjectionCore(modules=[module])
+        app.close()
+
+        copied = copy.deepcopy(app)
+        self.assertTrue(copied.is_closed)
+        self.assertFalse(hasattr(app.get, '__deepcopy__'))
+        with self.assertRaises(ContainerClosedError):
+            copied.get[ServiceA]()
+
     def test_context_manager_automatically_closes(self):
         """Context manager automatically closes"""
         module = KotInjectionModule()
@@ -442,6 +502,14 @@ class TestResourceCleanup(unittest.TestCase):
         # Automatically closed after exiting with statement
         self.assertTrue(app.is_closed)
 
+    def test_context_manager_propagates_exceptions(self):
+        """Exceptions inside the with block propagate after closing"""
+        with self.assertRaises(RuntimeError):
+            with KotInjectionCore() as app:
+                raise RuntimeError("boom")
+
+        self.assertTrue(app.is_closed)
+
     def test_unload_modules_from_app(self):
         """Unloads modules from isolated app"""
         module = KotInjectionModule()
@@ -462,5 +530,69 @@ class TestResourceCleanup(unittest.TestCase):
             app.get[ServiceA]()
 
 
+class TestIsolatedComponentGet(unittest.TestCase):
+    """Tests for the get property of IsolatedKotInjectionComponent"""
+
+    def _make_module(self):
+        module = KotInjectionModule()
+        with module:
+            module.single[ServiceA](lambda: ServiceA())
+        return module
+
+    def test_get_follows_get_app(self):
+        """get uses the app get_app() returns at the time of access"""
+        app1 = KotInjectionCore(modules=[self._make_module()])
+        app2 = KotInjectionCore(modules=[self._make_module()])
+        current = [app1]
+
+        class Component(IsolatedKotInjectionComponent):
+            def get_app(self):
+                return current[0]
+
+        component = Component()
+        service1 = component.get[ServiceA]()
+
+        current[0] = app2
+        service2 = component.get[ServiceA]()
+        self.assertIsNot(service1, service2)
+        self.assertIs(service2, app2.get[ServiceA]())
+
+    def test_get_leaves_instance_dict_untouched(self):
+        """Accessing get stores nothing on the component instance"""
+        app = KotInjectionCore(modules=[self._make_module()])
+
+        class Component(IsolatedKotInjectionComponent):
+            def get_app(self):
+                return app
+
+        component = Component()
+        component.get[ServiceA]()
+        self.assertEqual(vars(component), {})
+
+    def test_get_app_type_hints_resolve(self):
+        """get_app() return annotation resolves with a caller-supplied namespace"""
+        import typing
+        hints = typing.get_type_hints(
+            IsolatedKotInjectionComponent.get_app,
+            localns={'KotInjectionCore': KotInjectionCore},
+        )
+        self.assertIs(hints['return'], KotInjectionCore)
+
+    def test_closed_app_reports_closed(self):
+        """An app that is later closed raises ContainerClosedError"""
+        app = KotInjectionCore(modules=[self._make_module()])
+
+        class Component(IsolatedKotInjectionComponent):
+            def get_app(self):
+                return app
+
+        component = Component()
+        component.get[ServiceA]()
+        app.close()
+
+        with self.assertRaises(ContainerClosedError):
+            component.get[ServiceA]()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -85,6 +85,35 @@ class TestDefinitionDataclass(unittest.TestCase):
 
         self.assertIs(definition.instance, db_instance)
 
+    def test_definition_uses_slots(self):
+        """Definition stores its fields in slots, without an instance __dict__."""
+        definition = Definition(
+            interface=Database,
+            factory=lambda: Database(),
+            lifecycle=KotInjectionLifeCycle.SINGLETON,
+        )
+
+        self.assertFalse(hasattr(definition, '__dict__'))
+        with self.assertRaises(AttributeError):
+            definition.unknown = True
+
+    def test_definitions_compare_by_identity(self):
+        """Each Definition is a distinct registration, even with equal fields."""
+        factory = lambda: Database()
+        def1 = Definition(
+            interface=Database,
+            factory=factory,
+            lifecycle=KotInjectionLifeCycle.SINGLETON,
+        )
+        def2 = Definition(
+            interface=Database,
+            factory=factory,
+            lifecycle=KotInjectionLifeCycle.SINGLETON,
+        )
+
+        self.assertNotEqual(def1, def2)
+        self.assertEqual(len({def1, def2}), 2)
+
 
 class TestDefinitionLifecycle(unittest.TestCase):
     """Test Definition lifecycle values."""
@@ -100,6 +129,7 @@ class TestDefinitionLifecycle(unittest.TestCase):
 
         self.assertEqual(definition.lifecycle, KotInjectionLifeCycle.SINGLETON)
         self.assertEqual(definition.lifecycle.value, "SINGLETON")
+        self.assertTrue(definition._is_singleton)
 
     def test_factory_lifecycle(self):
         """FACTORY lifecycle is stored correctly."""
@@ -112,6 +142,29 @@ class TestDefinitionLifecycle(unittest.TestCase):
 
         self.assertEqual(definition.lifecycle, KotInjectionLifeCycle.FACTORY)
         self.assertEqual(definition.lifecycle.value, "FACTORY")
+        self.assertFalse(definition._is_singleton)
+
+    def test_abstract_interface_skips_validation(self):
+        """ABC interfaces are flagged to skip return-type validation."""
+        from abc import ABC, abstractmethod
+
+        class Repository(ABC):
+            @abstractmethod
+            def fetch(self): ...
+
+        abstract = Definition(
+            interface=Repository,
+            factory=lambda: None,
+            lifecycle=KotInjectionLifeCycle.SINGLETON,
+        )
+        concrete = Definition(
+            interface=Database,
+            factory=lambda: Database(),
+            lifecycle=KotInjectionLifeCycle.SINGLETON,
+        )
+
+        self.assertTrue(abstract._skip_validation)
+        self.assertFalse(concrete._skip_validation)
 
 
 class TestDefinitionIndependence(unittest.TestCase):
@@ -174,6 +227,15 @@ class TestDefinitionFromModule(unittest.TestCase):
         # parameter_types is None at registration time (lazy resolution)
         self.assertIsNone(definition.parameter_types)
 
+    def test_builders_use_slots(self):
+        """module.single / module.factory builders have no instance __dict__."""
+        module = KotInjectionModule()
+
+        for builder in (module.single, module.factory):
+            self.assertFalse(hasattr(builder, '__dict__'))
+            with self.assertRaises(AttributeError):
+                builder.unknown = True
+
     def test_module_creates_definition_for_factory(self):
         """Module registration creates correct Definition for factory."""
         module = KotInjectionModule()
@@ -208,7 +270,7 @@ class TestDefinitionFromModule(unittest.TestCase):
         KotInjection.start(modules=[module])
         try:
             KotInjection.get[UserRepository]()
-            self.assertEqual(definition.parameter_types, [Database, CacheService])
+            self.assertEqual(definition.parameter_types, (Database, CacheService))
         finally:
             KotInjection.stop()
 
@@ -378,5 +378,55 @@ class TestMultipleModulesEagerInit(KotInjectionTestCase):
         self.assertEqual(lazy_count, 0)
 
 
+class TestEagerInitWorklist(unittest.TestCase):
+    """Tests for the container's pending eager-initialization worklist."""
+
+    def test_worklist_cleared_after_initialization(self):
+        """eager_initialize() consumes the definitions collected at load time."""
+        from kotinjection.container import KotInjectionContainer
+
+        class Database:
+            pass
+
+        class CacheService:
+            pass
+
+        module = KotInjectionModule()
+        with module:
+            module.single[Database](lambda: Database(), created_at_start=True)
+            module.single[CacheService](lambda: CacheService())
+
+        container = KotInjectionContainer()
+        container.load_modules([module])
+        self.assertEqual(
+            [d.interface for d in container._eager_definitions], [Database]
+        )
+
+        container.eager_initialize()
+        self.assertEqual(container._eager_definitions, [])
+
+    def test_unloaded_definition_is_not_initialized(self):
+        """Definitions unloaded before eager_initialize() are skipped."""
+        from kotinjection.container import KotInjectionContainer
+
+        call_count = 0
+
+        class Database:
+            def __init__(self):
+                nonlocal call_count
+                call_count += 1
+
+        module = KotInjectionModule()
+        with module:
+            module.single[Database](lambda: Database(), created_at_start=True)
+
+        container = KotInjectionContainer()
+        container.load_modules([module])
+        container.unload_modules([module])
+        container.eager_initialize()
+
+        self.assertEqual(call_count, 0)
+
+
 if __name__ == '__main__':
     unittest.main()
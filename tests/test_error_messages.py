@@ -38,6 +38,16 @@ class UserRepository:
         self.db = db
 
 
+class CycleA:
+    def __init__(self, b: 'CycleB'):
+        self.b = b
+
+
+class CycleB:
+    def __init__(self, a: CycleA):
+        self.a = a
+
+
 class TestExceptionHierarchy(unittest.TestCase):
     """Test that all exceptions inherit from KotInjectionError."""
 
@@ -164,6 +174,29 @@ class TestDefinitionNotFoundErrorMessages(unittest.TestCase):
         self.assertIn("Hint", message)
         self.assertIn("single", message)
 
+    def test_registered_types_reflect_loaded_modules(self):
+        """Registered types are refreshed after loading more modules."""
+        module = KotInjectionModule()
+        with module:
+            module.single[Database](lambda: Database())
+
+        KotInjection.start(modules=[module])
+
+        with self.assertRaises(DefinitionNotFoundError) as ctx:
+            KotInjection.get[UserRepository]()
+        self.assertIn("Registered types: Database\n", str(ctx.exception))
+
+        cache_module = KotInjectionModule()
+        with cache_module:
+            cache_module.single[CacheService](lambda: CacheService())
+        KotInjection.load_modules([cache_module])
+
+        with self.assertRaises(DefinitionNotFoundError) as ctx:
+            KotInjection.get[UserRepository]()
+        self.assertIn(
+            "Registered types: Database, CacheService\n", str(ctx.exception)
+        )
+
 
 class TestDuplicateDefinitionErrorMessages(unittest.TestCase):
     """Test DuplicateDefinitionError message quality."""
@@ -300,6 +333,26 @@ class TestCircularDependencyErrorMessages(unittest.TestCase):
 
         app.close()
 
+    def test_message_lists_chain_in_resolution_order(self):
+        """Error message lists the chain from the outermost type inward."""
+        from kotinjection.core import KotInjectionCore
+
+        module = KotInjectionModule()
+        with module:
+            module.single[CycleA](lambda: CycleA(module.get()))
+            module.single[CycleB](lambda: CycleB(module.get()))
+
+        app = KotInjectionCore(modules=[module])
+
+        with self.assertRaises(CircularDependencyError) as ctx:
+            app.get[CycleA]()
+
+        self.assertIn(
+            f"{CycleA} -> {CycleB} -> {CycleA}", str(ctx.exception)
+        )
+
+        app.close()
+
 
 class TestResolutionContextErrorMessages(unittest.TestCase):
     """Test ResolutionContextError message quality."""
@@ -6,6 +6,7 @@ Tests for handling forward references and PEP 563 (from __future__ import annota
 
 from __future__ import annotations  # PEP 563: All annotations become strings
 
+import ast
 import sys
 import os
 import unittest
@@ -309,44 +310,221 @@ class TestPEP604UnionSyntax(KotInjectionTestCase):
         self.assertEqual(service.value, "test")
 
 
-class TestConvertUnionSyntax(unittest.TestCase):
-    """Unit tests for _convert_union_syntax helper method."""
+class TestResolveTypeHints(unittest.TestCase):
+    """Unit tests for _resolve_type_hints helper method."""
 
-    def test_no_union_unchanged(self):
-        """Annotation without | is unchanged."""
+    def test_hints_cached_and_read_only(self):
+        """Resolved hints are cached per class and cannot be mutated."""
+        from kotinjection.definition_builder import DefinitionBuilder, _clear_type_cache
+        _clear_type_cache()
+
+        hints = DefinitionBuilder._resolve_type_hints(UserRepository)
+
+        self.assertIs(hints, DefinitionBuilder._resolve_type_hints(UserRepository))
+        self.assertIs(hints['db'], Database)
+        with self.assertRaises(TypeError):
+            hints['db'] = CacheService
+
+    def test_failed_resolution_not_cached(self):
+        """A forward reference that later becomes resolvable is picked up."""
         from kotinjection.definition_builder import DefinitionBuilder
-        result = DefinitionBuilder._convert_union_syntax('int')
-        self.assertEqual(result, 'int')
 
-    def test_simple_union_conversion(self):
-        """X | Y is converted to Union[X, Y]."""
+        class Late:
+            def __init__(self, dep: LateDependency):
+                self.dep = dep
+
+        self.assertEqual(dict(DefinitionBuilder._resolve_type_hints(Late)), {})
+
+        globals()['LateDependency'] = Config
+        try:
+            hints = DefinitionBuilder._resolve_type_hints(Late)
+        finally:
+            del globals()['LateDependency']
+
+        self.assertIs(hints['dep'], Config)
+
+
+class TestResolveStringAnnotation(unittest.TestCase):
+    """Unit tests for _resolve_string_annotation helper method."""
+
+    def test_bare_identifier_skips_compile(self):
+        """A bare identifier is looked up without compiling an expression."""
+        from unittest import mock
         from kotinjection.definition_builder import DefinitionBuilder
-        result = DefinitionBuilder._convert_union_syntax('int | str')
-        self.assertEqual(result, 'Union[int, str]')
 
-    def test_optional_conversion(self):
-        """X | None is converted to Union[X, None]."""
+        with mock.patch(
+            "kotinjection.definition_builder._compile_annotation"
+        ) as compile_annotation:
+            resolved = DefinitionBuilder._resolve_string_annotation(
+                UserRepository, 'db', 'Database'
+            )
+
+        self.assertIs(resolved, Database)
+        compile_annotation.assert_not_called()
+
+    def test_expression_still_evaluated(self):
+        """Non-identifier annotations are still evaluated."""
+        from typing import Optional
         from kotinjection.definition_builder import DefinitionBuilder
-        result = DefinitionBuilder._convert_union_syntax('int | None')
-        self.assertEqual(result, 'Union[int, None]')
 
-    def test_nested_union_conversion(self):
-        """X | Y | Z is converted to Union[X, Y, Z]."""
+        resolved = DefinitionBuilder._resolve_string_annotation(
+            UserRepository, 'db', 'Database | None'
+        )
+        self.assertEqual(resolved, Optional[Database])
+
+    def test_union_compiled_without_unparse(self):
+        """Union annotations are compiled from the AST without re-stringifying."""
+        from typing import Optional, Union
+        from unittest import mock
+        from kotinjection.definition_builder import DefinitionBuilder, _clear_type_cache
+        _clear_type_cache()
+
+        with mock.patch(
+            "kotinjection.definition_builder.ast.unparse", wraps=ast.unparse
+        ) as unparse:
+            resolved = DefinitionBuilder._resolve_string_annotation(
+                UserRepository, 'db', 'list[Database | Config] | None'
+            )
+
+        self.assertEqual(resolved, Optional[list[Union[Database, Config]]])
+        unparse.assert_not_called()
+
+    def test_expression_uses_class_namespace_without_copying(self):
+        """Expressions see nested class names and leave module globals untouched."""
+        from typing import Optional
         from kotinjection.definition_builder import DefinitionBuilder
-        result = DefinitionBuilder._convert_union_syntax('int | str | None')
-        self.assertEqual(result, 'Union[int, str, None]')
 
-    def test_qualified_name_conversion(self):
-        """multiprocessing.Queue | None is converted correctly."""
+        class Outer:
+            class Inner:
+                pass
+
+        module_names = set(globals())
+        resolved = DefinitionBuilder._resolve_string_annotation(
+            Outer, 'inner', 'Inner | None'
+        )
+
+        self.assertEqual(resolved, Optional[Outer.Inner])
+        self.assertEqual(set(globals()), module_names)
+
+    def test_unknown_identifier_raises(self):
+        """An unknown bare identifier still raises TypeInferenceError."""
         from kotinjection.definition_builder import DefinitionBuilder
-        result = DefinitionBuilder._convert_union_syntax('multiprocessing.Queue | None')
-        self.assertEqual(result, 'Union[multiprocessing.Queue, None]')
+
+        with self.assertRaises(TypeInferenceError):
+            DefinitionBuilder._resolve_string_annotation(
+                UserRepository, 'db', 'MissingType'
+            )
+
+
+# Classes for string annotations with PEP 604 unions
+from typing import Literal
+
+
+class ServiceWithUnion:
+    """Service with a union of two registered types."""
+
+    def __init__(self, dep: Database | CacheService):
+        self.dep = dep
+
+
+class ServiceWithOptionalDatabase:
+    """Service with an optional dependency (X | None)."""
+
+    def __init__(self, db: Database | None):
+        self.db = db
+
+
+class ServiceWithGroupedUnion:
+    """Service with a parenthesized union inside a union."""
+
+    def __init__(self, dep: Database | (CacheService | Config) | None):
+        self.dep = dep
+
+
+class ServiceWithGenericUnion:
+    """Service with a union nested in a generic alias."""
+
+    def __init__(self, deps: list[Database | Config]):
+        self.deps = deps
+
+
+class ServiceWithPipeInLiteral:
+    """Service whose only pipe is inside a string literal."""
+
+    def __init__(self, mode: Literal["a|b"]):
+        self.mode = mode
+
+
+class TestPEP604StringAnnotations(unittest.TestCase):
+    """Tests that X | Y string annotations resolve to the expected types.
+
+    The parameter types discovered for a singleton are kept on its
+    definition, so each test checks what resolution evaluated.
+    """
+
+    def _parameter_types(self, cls, factory):
+        module = KotInjectionModule()
+        with module:
+            module.single[cls](factory)
+
+        app = KotInjectionCore(modules=[module])
+        self.addCleanup(app.close)
+        app.get[cls]()
+        return module.definitions[0].parameter_types
+
+    def test_simple_union(self):
+        """X | Y resolves to Union[X, Y]."""
+        from typing import Union
+        types = self._parameter_types(
+            ServiceWithUnion, lambda: ServiceWithUnion(Database())
+        )
+        self.assertEqual(types, (Union[Database, CacheService],))
+
+    def test_optional_union(self):
+        """X | None resolves to Optional[X]."""
+        from typing import Optional
+        types = self._parameter_types(
+            ServiceWithOptionalDatabase, lambda: ServiceWithOptionalDatabase(None)
+        )
+        self.assertEqual(types, (Optional[Database],))
+
+    def test_nested_union(self):
+        """X | Y | Z resolves to Union[X, Y, Z]."""
+        from typing import Union
+        types = self._parameter_types(
+            ServiceWithNestedUnion, lambda: ServiceWithNestedUnion("test")
+        )
+        self.assertEqual(types, (Union[int, str, None],))
+
+    def test_qualified_name_union(self):
+        """multiprocessing.Queue | None resolves although Queue is a method."""
+        from typing import Optional
+        types = self._parameter_types(
+            ServiceWithOptionalQueue, lambda: ServiceWithOptionalQueue(None)
+        )
+        self.assertEqual(types, (Optional[multiprocessing.Queue],))
+
+    def test_grouped_union_order_preserved(self):
+        """Parenthesized unions are flattened left to right."""
+        types = self._parameter_types(
+            ServiceWithGroupedUnion, lambda: ServiceWithGroupedUnion(None)
+        )
+        self.assertEqual(types[0].__args__, (Database, CacheService, Config, type(None)))
 
     def test_generic_with_union(self):
-        """List[int | str] is converted correctly."""
-        from kotinjection.definition_builder import DefinitionBuilder
-        result = DefinitionBuilder._convert_union_syntax('List[int | str]')
-        self.assertEqual(result, 'List[Union[int, str]]')
+        """list[X | Y] resolves to list[Union[X, Y]]."""
+        from typing import Union
+        types = self._parameter_types(
+            ServiceWithGenericUnion, lambda: ServiceWithGenericUnion([])
+        )
+        self.assertEqual(types, (list[Union[Database, Config]],))
+
+    def test_pipe_inside_string_literal(self):
+        """A pipe inside a string literal is not treated as a union."""
+        types = self._parameter_types(
+            ServiceWithPipeInLiteral, lambda: ServiceWithPipeInLiteral("a|b")
+        )
+        self.assertEqual(types, (Literal["a|b"],))
 
 
 if __name__ == '__main__':
@@ -7,9 +7,11 @@ the KotInjection.get[Type]() syntax.
 
 import unittest
 
-from kotinjection import KotInjection, KotInjectionModule
+from kotinjection import KotInjection, KotInjectionCore, KotInjectionModule
+from kotinjection.context import KotInjectionContext
 from kotinjection.get_proxy import KotInjectionGetProxy
-from kotinjection.exceptions import NotInitializedError
+from kotinjection.global_context import GlobalContext
+from kotinjection.exceptions import ContainerClosedError, NotInitializedError
 
 
 class Database:
@@ -24,6 +26,36 @@ class UserRepository:
         self.db = db
 
 
+class CustomContext(KotInjectionContext):
+    """Minimal context that does not cache its container."""
+
+    def __init__(self):
+        self._app = None
+
+    def get(self):
+        if self._app is None:
+            raise NotInitializedError("Not started")
+        return self._app
+
+    def get_or_null(self):
+        return self._app
+
+    def start(self, modules):
+        self._app = KotInjectionCore(modules=modules)
+        return self._app
+
+    def stop(self):
+        if self._app is not None:
+            self._app.close()
+            self._app = None
+
+    def load_modules(self, modules):
+        self.get().load_modules(modules)
+
+    def unload_modules(self, modules):
+        self.get().unload_modules(modules)
+
+
 class TestGetProxyDirectInstantiation(unittest.TestCase):
     """Test direct instantiation and usage of KotInjectionGetProxy."""
 
@@ -34,8 +66,8 @@ class TestGetProxyDirectInstantiation(unittest.TestCase):
         KotInjection.stop()
 
     def test_proxy_with_none_app_raises_error(self):
-        """Proxy raises NotInitializedError when app is None."""
-        proxy = KotInjectionGetProxy(lambda: None)
+        """Proxy raises NotInitializedError when the context is not started."""
+        proxy = KotInjectionGetProxy(lambda: GlobalContext())
 
         with self.assertRaises(NotInitializedError) as ctx:
             proxy[Database]()
@@ -155,6 +187,73 @@ class TestGetProxyErrorHandling(unittest.TestCase):
         with self.assertRaises(DefinitionNotFoundError):
             KotInjection.get[UserRepository]()
 
+    def test_proxy_reads_app_cached_by_context(self):
+        """Context caches the app on start() and clears it on stop()."""
+        module = KotInjectionModule()
+        with module:
+            module.single[Database](lambda: Database())
+
+        context = GlobalContext()
+        self.assertIsNone(context._cached_app)
+
+        app = context.start([module])
+        self.assertIs(context._cached_app, app)
+        self.assertIs(KotInjection.get[Database](), app.get[Database]())
+
+        context.stop()
+        self.assertIsNone(context._cached_app)
+        with self.assertRaises(NotInitializedError):
+            KotInjection.get[Database]()
+
+    def test_get_and_inject_after_app_close_raise_closed_error(self):
+        """Closing the global app directly makes get/inject raise ContainerClosedError."""
+        module = KotInjectionModule()
+        with module:
+            module.single[Database](lambda: Database())
+
+        class Service:
+            db = KotInjection.inject[Database]
+
+        KotInjection.start(modules=[module])
+        KotInjection._context.get().close()
+
+        with self.assertRaises(ContainerClosedError):
+            KotInjection.get[Database]()
+        with self.assertRaises(ContainerClosedError):
+            Service().db
+
+
+class TestGetProxyContextReassignment(unittest.TestCase):
+    """Test that the proxies follow KotInjection._context when it is replaced."""
+
+    def setUp(self):
+        KotInjection.stop()
+        self.original_context = KotInjection._context
+
+    def tearDown(self):
+        KotInjection._context.stop()
+        KotInjection._context = self.original_context
+        KotInjection.stop()
+
+    def test_get_and_inject_use_reassigned_context(self):
+        """get[Type]() and inject[Type] resolve from the context assigned later."""
+        module = KotInjectionModule()
+        with module:
+            module.single[Database](lambda: Database())
+
+        context = CustomContext()
+        KotInjection._context = context
+        KotInjection.start(modules=[module])
+        app = context.get()
+
+        self.assertIs(KotInjection.get[Database](), app.get[Database]())
+
+        class Service:
+            db = KotInjection.inject[Database]
+
+        self.assertIs(Service().db, app.get[Database]())
+        self.assertIsNone(self.original_context.get_or_null())
+
 
 class TestGetProxyClassAttribute(unittest.TestCase):
     """Test that get is a class attribute on KotInjection."""
@@ -164,6 +263,11 @@ class TestGetProxyClassAttribute(unittest.TestCase):
         self.assertTrue(hasattr(KotInjection, 'get'))
         self.assertIsInstance(KotInjection.get, KotInjectionGetProxy)
 
+    def test_get_proxy_has_no_instance_dict(self):
+        """KotInjection.get uses __slots__ and carries no __dict__."""
+        self.assertFalse(hasattr(KotInjection.get, '__dict__'))
+        self.assertFalse(hasattr(KotInjection.inject, '__dict__'))
+
     def test_get_persists_across_start_calls(self):
         """KotInjection.get persists across multiple start() calls."""
         proxy_before = KotInjection.get
@@ -201,6 +201,43 @@ class TestIsStartedMethod(unittest.TestCase):
 
         self.assertFalse(KotInjection.is_started())
 
+    def test_is_started_with_context_without_flag(self):
+        """is_started() works with a context that does not track _started"""
+
+        class CustomContext(KotInjectionContext):
+            def __init__(self):
+                self._app = None
+
+            def get(self):
+                return self._app
+
+            def get_or_null(self):
+                return self._app
+
+            def start(self, modules):
+                self._app = KotInjectionCore(modules=modules)
+                return self._app
+
+            def stop(self):
+                self._app = None
+
+            def load_modules(self, modules):
+                pass
+
+            def unload_modules(self, modules):
+                pass
+
+        original_context = KotInjection._context
+        KotInjection._context = CustomContext()
+        try:
+            self.assertFalse(KotInjection.is_started())
+            KotInjection.start(modules=[])
+            self.assertTrue(KotInjection.is_started())
+            KotInjection.stop()
+            self.assertFalse(KotInjection.is_started())
+        finally:
+            KotInjection._context = original_context
+
 
 class TestKotInjectionContextInterface(unittest.TestCase):
     """Tests for KotInjectionContext interface"""
@@ -252,6 +289,13 @@ class TestGlobalContext(unittest.TestCase):
         self.assertIs(ctx1, ctx2)
         self.assertIs(ctx2, ctx3)
 
+    def test_global_context_call_keeps_started_state(self):
+        """GlobalContext() does not reset a started context"""
+        app = GlobalContext().start(modules=[KotInjectionModule()])
+
+        self.assertIs(GlobalContext().get(), app)
+        self.assertTrue(KotInjection.is_started())
+
     def test_global_context_get_raises_when_not_started(self):
         """GlobalContext.get() raises NotInitializedError when not started"""
         context = GlobalContext()
@@ -0,0 +1,51 @@
+"""
+Package Export Tests
+
+Tests for the public symbols exposed by the kotinjection package
+and their lazy loading.
+"""
+
+import subprocess
+import sys
+import unittest
+
+import kotinjection
+
+
+class TestLazyExports(unittest.TestCase):
+    """Test lazy loading of the public API."""
+
+    def test_import_does_not_load_submodules(self):
+        """Importing the package does not import the container modules."""
+        code = (
+            "import sys, kotinjection; "
+            "print('kotinjection.container' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True, text=True, check=True,
+        )
+        self.assertEqual(result.stdout.strip(), "False")
+
+    def test_all_public_names_resolve(self):
+        """Every name in __all__ resolves to an object."""
+        for name in kotinjection.__all__:
+            with self.subTest(name=name):
+                self.assertIsNotNone(getattr(kotinjection, name))
+
+    def test_unknown_attribute_raises_attribute_error(self):
+        """Unknown names raise AttributeError."""
+        with self.assertRaises(AttributeError):
+            kotinjection.DoesNotExist
+
+    def test_lazy_table_matches_all(self):
+        """The lazy import table covers exactly the names in __all__."""
+        self.assertEqual(list(kotinjection._LAZY), list(kotinjection.__all__))
+
+    def test_dir_lists_public_api(self):
+        """dir() lists the public API."""
+        self.assertEqual(sorted(dir(kotinjection)), sorted(kotinjection.__all__))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,6 +7,7 @@ Verifies that the library performs well under load.
 
 import unittest
 import time
+from abc import ABC, abstractmethod
 from typing import List
 
 from kotinjection import KotInjection, KotInjectionModule
@@ -31,6 +32,24 @@ class UserRepository:
         self.cache = cache
 
 
+class IRepository(ABC):
+    """Abstract repository interface."""
+
+    @abstractmethod
+    def find(self): ...
+
+
+class SqlRepository(IRepository):
+    """IRepository implementation with dependencies."""
+
+    def __init__(self, db: Database, cache: CacheService):
+        self.db = db
+        self.cache = cache
+
+    def find(self):
+        return None
+
+
 class TestLargeModuleLoading(unittest.TestCase):
     """Test performance with large numbers of definitions."""
 
@@ -122,6 +141,713 @@ class TestResolutionPerformance(unittest.TestCase):
         self.assertLess(elapsed, 1.0, "1000 factory resolutions should be reasonably fast")
 
 
+class TestParameterTypeCaching(unittest.TestCase):
+    """Test that constructor analysis is not repeated needlessly."""
+
+    def test_factory_analyzes_implementation_once(self):
+        """Repeated factory resolutions analyze the implementation class once."""
+        from unittest import mock
+        from kotinjection.definition_builder import DefinitionBuilder, _clear_type_cache
+
+        module = KotInjectionModule()
+        with module:
+            module.single[Database](lambda: Database())
+            module.single[CacheService](lambda: CacheService())
+            module.factory[UserRepository](
+                lambda: UserRepository(module.get(), module.get())
+            )
+
+        app = KotInjectionCore(modules=[module])
+
+        _clear_type_cache()
+        with mock.patch.object(
+            DefinitionBuilder,
+            "_analyze_parameter_types",
+            wraps=DefinitionBuilder._analyze_parameter_types,
+        ) as analyze:
+            for _ in range(5):
+                app.get[UserRepository]()
+
+        analyzed = [c.args[0] for c in analyze.call_args_list]
+        self.assertEqual(analyzed.count(UserRepository), 1)
+
+        app.close()
+        _clear_type_cache()
+
+    def test_constructor_analysis_cached_per_class(self):
+        """A class constructor is analyzed once until the cache is cleared."""
+        from unittest import mock
+        from kotinjection.definition_builder import DefinitionBuilder, _clear_type_cache
+
+        _clear_type_cache()
+        with mock.patch.object(
+            DefinitionBuilder,
+            "_analyze_parameter_types",
+            wraps=DefinitionBuilder._analyze_parameter_types,
+        ) as analyze:
+            first = DefinitionBuilder._get_parameter_types(UserRepository)
+            second = DefinitionBuilder._get_parameter_types(UserRepository)
+            self.assertEqual(analyze.call_count, 1)
+
+            _clear_type_cache()
+            DefinitionBuilder._get_parameter_types(UserRepository)
+            self.assertEqual(analyze.call_count, 2)
+
+        self.assertEqual(first, (Database, CacheService))
+        self.assertIs(first, second)
+
+    def test_class_keyed_caches_are_bounded(self):
+        """Classes created at runtime do not accumulate in the analysis caches."""
+        from kotinjection.definition_builder import (
+            DefinitionBuilder,
+            _TYPE_CACHE_SIZE,
+            _cached_parameter_types,
+            _cached_signature,
+            _cached_type_hints,
+            _clear_type_cache,
+        )
+
+        _clear_type_cache()
+        for _ in range(_TYPE_CACHE_SIZE + 10):
+            cls = type("Dynamic", (), {"__init__": lambda self, db: None})
+            cls.__init__.__annotations__["db"] = Database
+            DefinitionBuilder._get_parameter_types(cls)
+
+        for cache in (_cached_parameter_types, _cached_signature, _cached_type_hints):
+            self.assertLessEqual(cache.cache_info().currsize, _TYPE_CACHE_SIZE)
+        _clear_type_cache()
+
+    def test_concrete_annotations_skip_type_hint_resolution(self):
+        """Constructors annotated with classes don't go through get_type_hints()."""
+        from unittest import mock
+        from kotinjection.definition_builder import DefinitionBuilder, _clear_type_cache
+
+        class ForwardRepository:
+            def __init__(self, db: "Database", cache: CacheService):
+                self.db = db
+                self.cache = cache
+
+        _clear_type_cache()
+        with mock.patch.object(
+            DefinitionBuilder,
+            "_resolve_type_hints",
+            wraps=DefinitionBuilder._resolve_type_hints,
+        ) as resolve:
+            concrete = DefinitionBuilder._get_parameter_types(UserRepository)
+            self.assertEqual(resolve.call_count, 0)
+
+            forward = DefinitionBuilder._get_parameter_types(ForwardRepository)
+            self.assertEqual(resolve.call_count, 1)
+
+        self.assertEqual(concrete, (Database, CacheService))
+        self.assertEqual(forward, (Database, CacheService))
+        _clear_type_cache()
+
+    def test_parameter_types_shared_across_containers(self):
+        """Definitions for the same class share one immutable tuple."""
+        def make_module():
+            module = KotInjectionModule()
+            with module:
+                module.single[Database](lambda: Database())
+                module.single[CacheService](lambda: CacheService())
+                module.single[UserRepository](
+                    lambda: UserRepository(module.get(), module.get())
+                )
+            return module
+
+        first = make_module()
+        second = make_module()
+        apps = [KotInjectionCore(modules=[first]), KotInjectionCore(modules=[second])]
+        for app in apps:
+            app.get[UserRepository]()
+
+        types_first = first.definitions[2].parameter_types
+        types_second = second.definitions[2].parameter_types
+        self.assertEqual(types_first, (Database, CacheService))
+        self.assertIs(types_first, types_second)
+
+        for app in apps:
+            app.close()
+
+    def test_failed_signature_inspection_cached(self):
+        """A class whose signature cannot be inspected is only inspected once."""
+        from unittest import mock
+        from kotinjection.definition_builder import DefinitionBuilder, _clear_type_cache
+        from kotinjection.exceptions import TypeInferenceError
+
+        _clear_type_cache()
+        with mock.patch(
+            "kotinjection.definition_builder.inspect.signature",
+            side_effect=ValueError("no signature found"),
+        ) as signature:
+            for _ in range(2):
+                with self.assertRaises(TypeInferenceError):
+                    DefinitionBuilder._get_parameter_types(UserRepository)
+
+        self.assertEqual(signature.call_count, 1)
+        _clear_type_cache()
+
+
+class TestDryRunSkipping(unittest.TestCase):
+    """Test that factories making no calls skip the dry-run."""
+
+    def test_factory_without_calls_skips_dry_run(self):
+        """A factory that makes no call at all needs no dry-run."""
+        database = Database()
+
+        module = KotInjectionModule()
+        with module:
+            module.factory[Database](lambda: database)
+
+        definition = module.definitions[0]
+        self.assertFalse(definition._needs_dry_run)
+
+        app = KotInjectionCore(modules=[module])
+        self.assertIs(app.get[Database](), database)
+        app.close()
+
+    def test_factory_with_calls_needs_dry_run(self):
+        """Factories making any call keep the dry-run."""
+        module = KotInjectionModule()
+        with module:
+            module.single[Database](lambda: Database())
+            module.single[CacheService](lambda: CacheService())
+            module.factory[UserRepository](
+                lambda: UserRepository(module.get(), module.get())
+            )
+
+        for definition in module.definitions:
+            self.assertTrue(definition._needs_dry_run)
+
+    def test_indirect_get_falls_back_to_dry_run(self):
+        """A factory calling get() through a helper still resolves."""
+        module = KotInjectionModule()
+
+        def build_repository():
+            return UserRepository(module.get(), module.get())
+
+        with module:
+            module.single[Database](lambda: Database())
+            module.single[CacheService](lambda: CacheService())
+            module.factory[UserRepository](lambda: build_repository())
+
+        app = KotInjectionCore(modules=[module])
+        repo = app.get[UserRepository]()
+
+        self.assertIsInstance(repo.db, Database)
+        self.assertIsInstance(repo.cache, CacheService)
+        app.close()
+
+    def test_aliased_get_behind_error_handler_resolves(self):
+        """An aliased getter whose errors are swallowed still gets its dependency."""
+        module = KotInjectionModule()
+        resolve = module.get
+
+        def lookup():
+            try:
+                return resolve()
+            except Exception:
+                return None
+
+        with module:
+            module.single[Database](lambda: Database())
+            module.single[CacheService](lambda: CacheService())
+            module.factory[UserRepository](lambda: UserRepository(lookup(), lookup()))
+
+        app = KotInjectionCore(modules=[module])
+        repo = app.get[UserRepository]()
+
+        self.assertIsInstance(repo.db, Database)
+        self.assertIsInstance(repo.cache, CacheService)
+        app.close()
+
+
+class TestFactoryImplementationMemo(unittest.TestCase):
+    """Test that factories returning one class skip repeated dry-runs."""
+
+    def test_stable_factory_runs_once_after_first_resolution(self):
+        """After the first resolution, a stable factory runs once per get()."""
+        calls = []
+
+        def create_repository():
+            calls.append(1)
+            return SqlRepository(module.get(), module.get())
+
+        module = KotInjectionModule()
+        with module:
+            module.single[Database](lambda: Database())
+            module.single[CacheService](lambda: CacheService())
+            # Abstract interface: the implementation is unknown until a dry-run
+            module.factory[IRepository](create_repository)
+
+        app = KotInjectionCore(modules=[module])
+
+        app.get[IRepository]()
+        self.assertEqual(len(calls), 2)  # dry-run + actual
+
+        repo = app.get[IRepository]()
+        self.assertEqual(len(calls), 3)  # actual only
+        self.assertIsInstance(repo.db, Database)
+        self.assertIsInstance(repo.cache, CacheService)
+
+        app.close()
+
+    def test_polymorphic_factory_falls_back_to_dry_run(self):
+        """A factory switching implementation classes still resolves correctly."""
+
+        class Base:
+            pass
+
+        class WithDatabase(Base):
+            def __init__(self, db: Database):
+                self.db = db
+
+        class WithCache(Base):
+            def __init__(self, cache: CacheService):
+                self.cache = cache
+
+        use_cache = [False]
+
+        def create_base():
+            if use_cache[0]:
+                return WithCache(module.get())
+            return WithDatabase(module.get())
+
+        module = KotInjectionModule()
+        with module:
+            module.single[Database](lambda: Database())
+            module.single[CacheService](lambda: CacheService())
+            module.factory[Base](create_base)
+
+        app = KotInjectionCore(modules=[module])
+
+        first = app.get[Base]()
+        self.assertIsInstance(first.db, Database)
+
+        use_cache[0] = True
+        second = app.get[Base]()
+        self.assertIsInstance(second, WithCache)
+        self.assertIsInstance(second.cache, CacheService)
+
+        app.close()
+
+    def test_polymorphic_factory_with_conditional_expression(self):
+        """A branching factory never reuses another implementation's types."""
+
+        class Base:
+            pass
+
+        class WithDatabase(Base):
+            def __init__(self, db: Database):
+                self.db = db
+
+        class WarmCache(Base):
+            def __init__(self, cache: CacheService):
+                cache.warm()
+                self.cache = cache
+
+        class WarmableCacheService(CacheService):
+            def warm(self):
+                pass
+
+        use_cache = [False]
+        database_calls = []
+
+        def create_database():
+            database_calls.append(1)
+            return Database()
+
+        def pick():
+            return use_cache[0]
+
+        module = KotInjectionModule()
+        with module:
+            module.factory[Database](create_database)
+            module.single[CacheService](lambda: WarmableCacheService())
+            module.factory[Base](lambda: WarmCache(module.get()) if pick() else WithDatabase(module.get()))
+
+        app = KotInjectionCore(modules=[module])
+
+        first = app.get[Base]()
+        self.assertIsInstance(first.db, Database)
+
+        use_cache[0] = True
+        database_calls.clear()
+        second = app.get[Base]()
+        self.assertIsInstance(second, WarmCache)
+        self.assertIsInstance(second.cache, WarmableCacheService)
+        # No Database was created for the WarmCache constructor
+        self.assertEqual(database_calls, [])
+
+        app.close()
+
+    def test_branch_free_polymorphic_factory_retries_via_dry_run(self):
+        """An error caused by reused types is retried with the right types."""
+
+        class Base:
+            pass
+
+        class WithDatabase(Base):
+            def __init__(self, db: Database):
+                self.db = db
+
+        class WarmCache(Base):
+            def __init__(self, cache: CacheService):
+                cache.warm()
+                self.cache = cache
+
+        class WarmableCacheService(CacheService):
+            def warm(self):
+                pass
+
+        implementation = [WithDatabase]
+
+        def choose():
+            return implementation[0]
+
+        module = KotInjectionModule()
+        with module:
+            module.single[Database](lambda: Database())
+            module.single[CacheService](lambda: WarmableCacheService())
+            # No branches in the factory itself - the class comes from a helper
+            module.factory[Base](lambda: choose()(module.get()))
+
+        app = KotInjectionCore(modules=[module])
+
+        first = app.get[Base]()
+        self.assertIsInstance(first.db, Database)
+
+        implementation[0] = WarmCache
+        second = app.get[Base]()
+        self.assertIsInstance(second, WarmCache)
+        self.assertIsInstance(second.cache, WarmableCacheService)
+
+        app.close()
+
+    def test_factory_error_is_reported_via_dry_run(self):
+        """An error raised by the factory itself is reported after the dry-run."""
+        from kotinjection.exceptions import TypeInferenceError
+
+        calls = []
+        fail = [False]
+
+        def check():
+            if fail[0]:
+                raise RuntimeError("boom")
+
+        def create_repository():
+            calls.append(1)
+            check()
+            return UserRepository(module.get(), module.get())
+
+        module = KotInjectionModule()
+        with module:
+            module.single[Database](lambda: Database())
+            module.single[CacheService](lambda: CacheService())
+            module.factory[UserRepository](create_repository)
+
+        app = KotInjectionCore(modules=[module])
+        app.get[UserRepository]()
+        self.assertEqual(len(calls), 2)  # dry-run + actual
+
+        fail[0] = True
+        with self.assertRaises(TypeInferenceError):
+            app.get[UserRepository]()
+        self.assertEqual(len(calls), 4)  # actual + dry-run reporting the error
+
+        app.close()
+
+
+class TestConcreteClassRegistration(unittest.TestCase):
+    """Test that factories for concrete classes discover their implementation."""
+
+    def test_subclass_dependencies_come_from_dry_run(self):
+        """A subclass with another constructor only gets its own dependencies."""
+        database_calls = []
+
+        def create_database():
+            database_calls.append(1)
+            return Database()
+
+        class CachedRepository(UserRepository):
+            def __init__(self, cache: CacheService):
+                self.cache = cache
+
+        module = KotInjectionModule()
+        with module:
+            module.single[Database](create_database)
+            module.single[CacheService](lambda: CacheService())
+            module.single[UserRepository](lambda: CachedRepository(module.get()))
+
+        app = KotInjectionCore(modules=[module])
+        repo = app.get[UserRepository]()
+
+        self.assertIsInstance(repo, CachedRepository)
+        self.assertIsInstance(repo.cache, CacheService)
+        self.assertEqual(module.definitions[2].parameter_types, (CacheService,))
+        self.assertEqual(database_calls, [])
+        app.close()
+
+    def test_raising_factory_runs_once(self):
+        """A failing factory is not retried."""
+        from kotinjection.exceptions import TypeInferenceError
+
+        calls = []
+
+        def create_repository():
+            calls.append(1)
+            raise RuntimeError("boom")
+
+        module = KotInjectionModule()
+        with module:
+            module.single[UserRepository](create_repository)
+
+        app = KotInjectionCore(modules=[module])
+        with self.assertRaises(TypeInferenceError):
+            app.get[UserRepository]()
+
+        self.assertEqual(len(calls), 1)
+        app.close()
+
+    def test_unanalyzable_interface_falls_back(self):
+        """An interface without type hints falls back to dry-run discovery."""
+
+        class Service:
+            def __init__(self, db):
+                self.db = db
+
+        class HintedService(Service):
+            def __init__(self, db: Database):
+                super().__init__(db)
+
+        module = KotInjectionModule()
+        with module:
+            module.single[Database](lambda: Database())
+            module.single[Service](lambda: HintedService(module.get()))
+
+        app = KotInjectionCore(modules=[module])
+        service = app.get[Service]()
+
+        self.assertIsInstance(service, HintedService)
+        self.assertIsInstance(service.db, Database)
+        app.close()
+
+
+class TestSingletonCache(unittest.TestCase):
+    """Test the container's cache of created singleton instances."""
+
+    def _load(self):
+        from kotinjection.container import KotInjectionContainer
+
+        module = KotInjectionModule()
+        with module:
+            module.single[Database](lambda: Database())
+
+        container = KotInjectionContainer()
+        container.load_modules([module])
+        return module, container
+
+    def test_repeated_get_skips_resolution(self):
+        """Once created, a singleton is returned without resolving again."""
+        from unittest import mock
+        from kotinjection.container import KotInjectionContainer
+
+        _, container = self._load()
+        first = container.get(Database)
+        self.assertIs(container._singleton_cache[Database], first)
+
+        container._resolvers[Database] = mock.Mock(side_effect=AssertionError)
+        with mock.patch.object(
+            KotInjectionContainer, "_resolve", side_effect=AssertionError
+        ) as resolve:
+            for _ in range(3):
+                self.assertIs(container.get(Database), first)
+
+        resolve.assert_not_called()
+
+    def test_unload_invalidates_cache(self):
+        """Unloading a module drops its cached singletons."""
+        from kotinjection.exceptions import DefinitionNotFoundError
+
+        module, container = self._load()
+        first = container.get(Database)
+
+        container.unload_modules([module])
+        self.assertNotIn(Database, container._singleton_cache)
+        with self.assertRaises(DefinitionNotFoundError):
+            container.get(Database)
+
+        replacement = KotInjectionModule()
+        with replacement:
+            replacement.single[Database](lambda: Database())
+        container.load_modules([replacement])
+        self.assertIsNot(container.get(Database), first)
+
+    def test_clear_invalidates_cache(self):
+        """clear() drops every cached singleton."""
+        from kotinjection.exceptions import DefinitionNotFoundError
+
+        _, container = self._load()
+        container.get(Database)
+
+        container.clear()
+        self.assertEqual(container._singleton_cache, {})
+        with self.assertRaises(DefinitionNotFoundError):
+            container.get(Database)
+
+    def test_close_releases_singletons(self):
+        """Closing the app frees singletons stored on the module's definitions."""
+        import gc
+        import weakref
+
+        module = KotInjectionModule()
+        with module:
+            module.single[Database](lambda: Database())
+
+        app = KotInjectionCore(modules=[module])
+        ref = weakref.ref(app.get[Database]())
+
+        app.close()
+        gc.collect()
+        self.assertIsNone(module.definitions[0].instance)
+        self.assertIsNone(ref())
+
+
+class TestResolverClosures(unittest.TestCase):
+    """Test the per-definition resolver closures built at load time."""
+
+    def _module(self, instance):
+        module = KotInjectionModule()
+        with module:
+            module.single[Database](lambda: instance)
+        return module
+
+    def test_unload_drops_resolver(self):
+        """Unloading a module removes the resolvers of its definitions."""
+        from kotinjection.container import KotInjectionContainer
+
+        module = self._module(Database())
+        container = KotInjectionContainer()
+        container.load_modules([module])
+        self.assertIn(Database, container._resolvers)
+
+        container.unload_modules([module])
+        self.assertNotIn(Database, container._resolvers)
+
+    def test_reload_rebuilds_resolver(self):
+        """Loading a replacement module builds a resolver for the new definition."""
+        from kotinjection.container import KotInjectionContainer
+
+        old_db, new_db = Database(), Database()
+        old_module = self._module(old_db)
+        container = KotInjectionContainer()
+        container.load_modules([old_module])
+        old_resolver = container._resolvers[Database]
+        self.assertIs(container.get(Database), old_db)
+
+        container.unload_modules([old_module])
+        container.load_modules([self._module(new_db)])
+
+        self.assertIsNot(container._resolvers[Database], old_resolver)
+        self.assertIs(container.get(Database), new_db)
+
+    def test_clear_drops_resolvers(self):
+        """clear() removes every resolver."""
+        from kotinjection.container import KotInjectionContainer
+
+        container = KotInjectionContainer()
+        container.load_modules([self._module(Database())])
+
+        container.clear()
+        self.assertEqual(container._resolvers, {})
+
+
+class TestResolutionContextPool(unittest.TestCase):
+    """Test that resolution contexts are recycled between resolutions."""
+
+    def test_dry_run_contexts_are_returned_in_normal_mode(self):
+        """Contexts used for dry-runs go back to the pool with dry_run cleared."""
+        module = KotInjectionModule()
+        with module:
+            module.single[Database](lambda: Database())
+            module.single[CacheService](lambda: CacheService())
+            module.single[UserRepository](
+                lambda: UserRepository(module.get(), module.get())
+            )
+
+        app = KotInjectionCore(modules=[module])
+        repo = app.get[UserRepository]()
+
+        pool = app._container._context_pool
+        self.assertTrue(pool)
+        self.assertFalse(any(ctx.dry_run for ctx in pool))
+        self.assertIsInstance(repo.db, Database)
+
+        app.close()
+
+
+class TestContainerSubscript(unittest.TestCase):
+    """Test container[Type] getter reuse."""
+
+    def test_subscript_returns_same_getter_per_type(self):
+        """container[Type] is built once per type and still resolves."""
+        from kotinjection.container import KotInjectionContainer
+
+        module = KotInjectionModule()
+        with module:
+            module.factory[Database](lambda: Database())
+
+        container = KotInjectionContainer()
+        container.load_modules([module])
+
+        self.assertIs(container[Database], container[Database])
+        self.assertIsInstance(container[Database](), Database)
+
+    def test_subscript_memo_tracks_registered_types(self):
+        """Only registered types are memoized; unload and clear evict them."""
+        from kotinjection.container import KotInjectionContainer
+
+        module = KotInjectionModule()
+        with module:
+            module.factory[Database](lambda: Database())
+
+        container = KotInjectionContainer()
+        container.load_modules([module])
+
+        container[CacheService]
+        container["Database"]
+        container[Database]
+        self.assertEqual(list(container._getters), [Database])
+
+        container.unload_modules([module])
+        self.assertEqual(container._getters, {})
+
+        container.load_modules([module])
+        container[Database]
+        container.clear()
+        self.assertEqual(container._getters, {})
+
+
+class TestBuilderSubscript(unittest.TestCase):
+    """Test module.single[Type] / module.factory[Type] reuse."""
+
+    def test_subscript_returns_same_register_per_type(self):
+        """builder[Type] is built once per type and each call registers anew."""
+        module = KotInjectionModule()
+
+        self.assertIs(module.single[Database], module.single[Database])
+        self.assertIsNot(module.single[Database], module.factory[Database])
+
+        with module:
+            module.single[Database](lambda: Database())
+            module.single[CacheService](lambda: CacheService(), created_at_start=True)
+            module.single[Database](lambda: Database())
+
+        definitions = module.definitions
+        self.assertEqual(len(definitions), 3)
+        self.assertEqual([d.created_at_start for d in definitions], [False, True, False])
+
+
 class TestDeepNestingPerformance(unittest.TestCase):
     """Test performance with deeply nested dependencies."""
 
@@ -195,6 +195,34 @@ class TestFactoryTypeRegistration(KotInjectionTestCase):
         self.assertIs(repo1.db, repo2.db)
         self.assertIs(repo1.cache, repo2.cache)
 
+    def test_factory_type_analyzes_constructor_once(self):
+        """Type registration analyzes the constructor once and skips dry-run."""
+        from unittest import mock
+        from kotinjection.definition_builder import DefinitionBuilder
+
+        module = KotInjectionModule()
+        with module:
+            module.single[Database](Database)
+            module.single[CacheService](CacheService)
+            module.factory[UserRepository](UserRepository)
+
+        definition = module.definitions[-1]
+        self.assertIs(definition.implementation_type, UserRepository)
+        self.assertFalse(definition._needs_dry_run)
+
+        KotInjection.start(modules=[module])
+
+        with mock.patch.object(
+            DefinitionBuilder,
+            "_get_parameter_types",
+            wraps=DefinitionBuilder._get_parameter_types,
+        ) as analyze:
+            for _ in range(3):
+                KotInjection.get[UserRepository]()
+
+        analyzed = [c.args[0] for c in analyze.call_args_list]
+        self.assertEqual(analyzed.count(UserRepository), 1)
+
 
 class TestMixedRegistration(KotInjectionTestCase):
     """Tests for mixing type and lambda registration."""
@@ -217,5 +245,52 @@ class TestMixedRegistration(KotInjectionTestCase):
         self.assertIsInstance(repo.cache, CacheService)
 
 
+
+class TestRegisterMany(KotInjectionTestCase):
+    """Tests for builder.register_many() batch registration."""
+
+    def test_register_many_mixes_types_and_factories(self):
+        """Batch registration accepts both factories and implementation types."""
+        module = KotInjectionModule()
+        with module:
+            module.single.register_many([
+                (Database, lambda: Database()),
+                (CacheService, CacheService),
+                (UserRepository, UserRepository),
+            ])
+            module.factory.register_many([(RequestHandler, RequestHandler)])
+
+        self.assertEqual(
+            [d.interface for d in module.definitions],
+            [Database, CacheService, UserRepository, RequestHandler],
+        )
+
+        KotInjection.start(modules=[module])
+
+        repo = KotInjection.get[UserRepository]()
+        self.assertIsInstance(repo.db, Database)
+        self.assertIs(repo, KotInjection.get[UserRepository]())
+        self.assertIsNot(
+            KotInjection.get[RequestHandler](), KotInjection.get[RequestHandler]()
+        )
+
+    def test_register_many_created_at_start(self):
+        """created_at_start applies to every singleton in the batch."""
+        module = KotInjectionModule()
+        with module:
+            module.single.register_many(
+                [(Database, Database), (CacheService, CacheService)],
+                created_at_start=True,
+            )
+            module.factory.register_many(
+                [(RequestHandler, lambda: RequestHandler(module.get()))],
+                created_at_start=True,
+            )
+
+        self.assertEqual(
+            [d.created_at_start for d in module.definitions], [True, True, False]
+        )
+
+
 if __name__ == '__main__':
     unittest.main()